@@ -0,0 +1,15 @@
+from weather.cache import DatasetCache
+from weather.engine import load_dataframe
+
+
+def test_mixed_dtypes_and_text_columns_are_cached(tmp_path):
+    path = tmp_path / 'station.csv'
+    path.write_text("Date,Temperature_C,Humidity_pct,Station\n"
+                    "2024-01-01,20.5,60,Kolkata\n2024-01-02,21.5,61,\n2024-01-03,19.5,62,Kolkata\n")
+    cache = DatasetCache(str(tmp_path / 'cache'))
+    built = cache.load(str(path), load_dataframe)
+    cached = cache.load(str(path), load_dataframe)
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+    assert cached.equals(built) # Same values and dtypes; the cached columns are memory-mapped
+    assert cached['Humidity_pct'].dtype == 'int64'
+    assert cached['Station'].isna().tolist() == [False, True, False]
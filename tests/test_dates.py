@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from weather.dates import parse_dates, sniff_date_format
+from weather.engine import DataError, clean_frame
+
+
+def _hourly(fmt, days):
+    return pd.Series(pd.date_range('2021-01-01', periods=days * 24, freq='h').strftime(fmt))
+
+
+def test_month_first_found_when_head_and_tail_fit_both():
+    # Jan 1-12 at the head and Feb 1-9 at the tail read either way; only the middle settles it
+    values = _hourly('%m/%d/%Y %H:%M', 40)
+    assert sniff_date_format(values) == '%m/%d/%Y %H:%M'
+
+
+def test_ambiguous_day_month_order_is_an_error():
+    values = _hourly('%d/%m/%Y', 12)
+    with pytest.raises(ValueError, match='--date-format'):
+        sniff_date_format(values)
+    df = pd.DataFrame({'Date': values, 'Temperature_C': 20.0, 'Humidity_pct': 50.0})
+    with pytest.raises(DataError):
+        clean_frame(df)
+    assert len(clean_frame(df, date_format='%d/%m/%Y')) == 12
+
+
+def test_bad_cells_are_coerced_not_reparsed():
+    values = _hourly('%d/%m/%Y %H:%M', 30)
+    values[[3, 400]] = ['garbage', '2021-01-17 16:00']
+    dates, date_format, coerced = parse_dates(values)
+    assert date_format == '%d/%m/%Y %H:%M'
+    assert coerced == 2
+    assert dates.isna().sum() == 2
+
+
+def test_mean_rule_keeps_text_columns():
+    df = pd.DataFrame({
+        'Date': ['2024-01-01', '2024-01-02', '2024-01-02', '2024-01-03'],
+        'Temperature_C': [10.0, 20.0, 30.0, 40.0],
+        'Humidity_pct': [50, 60, 70, 80],
+        'Station': ['Kolkata', 'Kolkata', None, 'Kolkata'],
+    })
+    cleaned = clean_frame(df, duplicates='mean')
+    assert cleaned['Temperature_C'].tolist() == [10.0, 25.0, 40.0]
+    assert cleaned['Humidity_pct'].tolist() == [50.0, 65.0, 80.0]
+    assert cleaned['Station'].tolist() == ['Kolkata'] * 3
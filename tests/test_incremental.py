@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from weather.engine import analyze_periods, clean_frame
+from weather.incremental import IncrementalAnalyzer
+
+COLUMNS = ['window', 'column', 'stat']
+
+
+def _raw(rows):
+    return pd.DataFrame(rows, columns=['Date', 'Temperature_C', 'Humidity_pct'])
+
+
+@pytest.mark.parametrize('duplicates', ['last', 'first', 'mean', 'keep'])
+def test_repeated_timestamps_match_a_reload(duplicates):
+    batches = [
+        [('2024-01-01', 10.0, 50.0), ('2024-01-02', 15.0, 60.0)],
+        [('2024-01-02', 17.0, 64.0), ('2024-01-02', 19.0, 61.0)], # Re-sent and corrected readings
+        [('2024-01-03', 12.0, 55.0), ('2024-01-03', 14.0, 57.0), ('2024-01-04', 11.0, 52.0)],
+    ]
+    analyzer = IncrementalAnalyzer(duplicates=duplicates)
+    for batch in batches:
+        analyzer.append(_raw(batch))
+
+    reloaded = clean_frame(_raw([row for batch in batches for row in batch]), duplicates=duplicates)
+    expected = analyze_periods(reloaded).set_index(COLUMNS)['value']
+    result = analyzer.results().set_index(COLUMNS)['value']
+    assert np.allclose(result, expected.loc[result.index])
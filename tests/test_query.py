@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from weather.compact import CompactFrame
+from weather.query import QueryIndex
+
+
+def _frame():
+    index = pd.date_range('2021-03-30', periods=24 * 5, freq='h', name='Date').as_unit('us')
+    return pd.DataFrame({'Temperature_C': np.arange(len(index), dtype=float)}, index=index)
+
+
+def _index(compact):
+    df = _frame()
+    index = QueryIndex()
+    index.add('station', CompactFrame.from_frame(df) if compact else df)
+    return index, df
+
+
+def test_date_only_end_covers_the_whole_day():
+    for compact in (False, True):
+        index, df = _index(compact)
+        result = index.collect(start='2021-03-31', end='2021-04-01')
+        assert len(result) == len(df.loc['2021-03-31':'2021-04-01'])
+        assert result.index[-1] == pd.Timestamp('2021-04-01 23:00')
+
+
+def test_end_with_a_time_is_exact():
+    index, _ = _index(False)
+    result = index.collect(end='2021-03-30 05:00')
+    assert result.index[-1] == pd.Timestamp('2021-03-30 05:00')
+
+
+def test_limit_is_reflected_in_rows_matched():
+    for compact in (False, True):
+        index, _ = _index(compact)
+        result = index.collect(where='Temperature_C >= 10', limit=45)  # Spans both months
+        assert len(result) == 45
+        assert index.last_stats.rows_matched == 45
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from weather.engine import analyze_file
+from weather.summary import OVERALL_WINDOW
+
+
+def _write(path, rows=24 * 60):
+    rng = np.random.default_rng(3)
+    dates = pd.date_range('2022-01-01', periods=rows, freq='h')
+    df = pd.DataFrame({
+        'Date': dates.strftime('%Y-%m-%d %H:%M:%S'),
+        'Temperature_C': rng.normal(20, 8, rows).round(1).astype(object),
+        'Humidity_pct': rng.uniform(10, 100, rows).round(0).astype(int).astype(object),
+        'Station': 'Kolkata', # Text columns are not loaded
+    })
+    df.loc[[100, 900], 'Temperature_C'] = '--'
+    df.loc[1200, 'Humidity_pct'] = 'n/a' # A second column going bad in a later chunk
+    df.to_csv(path, index=False)
+
+
+def test_streamed_summary_matches_the_readings(tmp_path):
+    path = tmp_path / 'hourly.csv'
+    _write(path)
+    df, table, _, _ = analyze_file(str(path), chunksize=500)
+    assert list(df.columns) == ['Temperature_C', 'Humidity_pct']
+    assert df.dtypes.eq(np.float32).all()
+    _, full, _, _ = analyze_file(str(path))
+    streamed = table[table['window'] == OVERALL_WINDOW].set_index(['column', 'stat'])['value']
+    whole = full[full['window'] == OVERALL_WINDOW].set_index(['column', 'stat'])['value']
+    assert set(streamed.index.get_level_values('stat')) == {'count', 'mean', 'min', 'max'}
+    assert np.allclose(streamed, whole.loc[streamed.index], atol=1e-4)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from weather.summary import iter_windows, summarize
+
+QUANTILES = {'p10': 0.10, 'p50': 0.50, 'p90': 0.90}
+
+
+def _frame(rows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2020-01-01 06:30', periods=rows, freq='7h', name='Date')
+    df = pd.DataFrame({
+        'Temperature_C': rng.normal(25, 6, rows),  # Off the 0.1 grid
+        'Humidity_pct': rng.uniform(0, 90_000, rows),  # Wide value range
+    }, index=index)
+    df.iloc[rng.choice(rows, 150, replace=False), 0] = np.nan
+    return df
+
+
+def _expected(df, start, end):
+    part = df.loc[start:end]
+    stats = part.agg(['count', 'mean', 'std', 'min', 'max'])
+    for name, q in QUANTILES.items():
+        stats.loc[name] = part.quantile(q)
+    return stats
+
+
+def _check(df, windows):
+    table = summarize(df, windows)
+    results = {name: stats for name, _, _, stats in iter_windows(table)}
+    for name, (start, end) in windows.items():
+        expected = _expected(df, start, end)
+        for column in df.columns:
+            count = expected.loc['count', column]
+            if count == 0:
+                assert results[name] is None or results[name][column]['count'] == 0
+                continue
+            got = results[name][column]
+            for stat in ['count', 'mean', 'std', 'min', 'max', *QUANTILES]:
+                assert got[stat] == pytest.approx(expected.loc[stat, column], rel=1e-9, abs=1e-9, nan_ok=True), \
+                    (name, column, stat)
+
+
+def test_summarize_matches_pandas_on_off_grid_values():
+    df = _frame()
+    end = df.index.max()
+    windows = {
+        'week': (end - pd.Timedelta(days=7), end),
+        'month': (end - pd.Timedelta(days=30), end),
+        'middle': (pd.Timestamp('2020-03-02 10:00'), pd.Timestamp('2020-05-17 23:59')),
+        'overlap': (pd.Timestamp('2020-04-01'), pd.Timestamp('2020-07-01')),
+        'all': (df.index.min(), end),
+        'empty': (pd.Timestamp('2019-01-01'), pd.Timestamp('2019-02-01')),
+    }
+    _check(df, windows)
+
+
+def test_single_value_window_percentiles_stay_within_range():
+    index = pd.DatetimeIndex(['2024-01-01', '2024-01-02', '2024-01-03'], name='Date')
+    df = pd.DataFrame({'Temperature_C': [0.839, 12.3456, -4.2]}, index=index)
+    table = summarize(df, {'one': (index[0], index[0]), 'all': (index[0], index[-1])})
+    stats = {name: s for name, _, _, s in iter_windows(table)}
+    assert stats['one']['Temperature_C']['p50'] == 0.839
+    _check(df, {'one': (index[0], index[0]), 'all': (index[0], index[-1])})
+
+
+def test_compact_frame_matches_pandas_for_bounds_between_grid_points():
+    from weather.compact import CompactFrame
+
+    index = pd.date_range('2025-09-01 20:42', periods=60, freq='D', name='Date')
+    df = pd.DataFrame({'Temperature_C': np.round(np.linspace(10, 30, 60), 1)}, index=index)
+    windows = {
+        'inner': (pd.Timestamp('2025-10-10'), pd.Timestamp('2025-10-20 00:00')),
+        'exact': (index[5], index[20]),
+    }
+    expected = summarize(df, windows)
+    got = summarize(CompactFrame.from_frame(df), windows)
+    pd.testing.assert_frame_equal(got, expected)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from weather.compact import CompactFrame
+from weather.engine import analyze_periods
+from weather.window_index import WindowIndex
+
+
+def _frame(rows=3000, seed=1):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2019-06-01', periods=rows, freq='5h', name='Date')
+    df = pd.DataFrame({
+        'Temperature_C': rng.normal(25, 6, rows).round(1),
+        'Humidity_pct': rng.uniform(20, 100, rows).round(1),
+    }, index=index)
+    df.iloc[rng.choice(rows, 200, replace=False), 1] = np.nan
+    return df
+
+
+def test_window_stats_match_pandas():
+    df = _frame()
+    index = WindowIndex(df)
+    for start, end in [('2019-06-01', '2021-01-01'), ('2020-02-03 07:00', '2020-02-03 07:00'),
+                       ('2019-06-01', df.index[-1]), ('2020-05-05', '2020-09-17 12:00')]:
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        part = df.loc[start:end] # Timestamps, so a date-only end is midnight rather than the whole day
+        stats = index.window_stats(start, end)
+        for col in df.columns:
+            assert stats[col]['count'] == part[col].count()
+            assert np.isclose(stats[col]['mean'], part[col].mean())
+            assert np.isclose(stats[col]['min'], part[col].min())
+            assert np.isclose(stats[col]['max'], part[col].max())
+            if part[col].count() > 1:
+                assert np.isclose(stats[col]['std'], part[col].std())
+    assert index.window_stats('2030-01-01', '2030-02-01') is None
+
+
+def test_analysis_with_index_matches_without():
+    df = _frame()
+    for frame in (df, CompactFrame.from_frame(df)):
+        plain = analyze_periods(frame)
+        indexed = analyze_periods(frame, index=WindowIndex(frame))
+        assert (plain[['window', 'column', 'stat']] == indexed[['window', 'column', 'stat']]).all().all()
+        assert np.allclose(plain['value'], indexed['value'], rtol=1e-6, equal_nan=True)
@@ -0,0 +1,7 @@
+"""
+Time-Series Weather Data Analyst.
+
+`weather.engine` holds the headless analysis pipeline, `weather.app` the Tkinter
+front-end and `weather.cli` the `python -m weather` entry point. Nothing is
+imported here so that `import weather` stays cheap.
+"""
@@ -0,0 +1,560 @@
+import tkinter as tk
+from tkinter import filedialog, ttk, messagebox, scrolledtext
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from . import engine
+from .cache import DatasetCache
+from .climatology import build_climatology, climatology_markdown, climatology_tables, climatology_text
+from .dates import LoadReport
+from .instrument import TIMINGS, profile_to, write_memory_snapshot
+from .memo import SeriesMemo, dataset_fingerprint
+from .config import (
+    ACCENT_COLOR, APP_TITLE, BG_COLOR, DUMMY_DATA_FILENAME, PRIMARY_COLOR,
+    REPORT_FILENAME, TEXT_COLOR, WINDOW_SIZE,
+)
+
+JOB_POLL_MS = 40 # How often the Tk loop checks the worker's result queue
+# Text tag per metric column in the Analysis tab; other columns use 'other_metric'
+METRIC_TAGS = {'Temperature_C': 'temp_metric', 'Humidity_pct': 'humid_metric'}
+
+# --- Main Application Class ---
+
+class WeatherAnalyzerApp:
+    def __init__(self, master):
+        self.master = master
+        master.title(APP_TITLE)
+        master.geometry(WINDOW_SIZE)
+        master.configure(bg=BG_COLOR)
+
+        self.df = None # DataFrame to hold the loaded data
+        self.index = None # WindowIndex over self.df, built at load, for O(log n) window statistics
+        self.report_content = [] # List to store report sections
+        self.analysis_table = None # Summary table of the last period analysis; the report summary is read from it
+        self.max_date = None
+        self.is_loaded = False
+        self.cache = DatasetCache() # Columnar cache so re-opening an unchanged CSV skips parsing
+        self.memo = SeriesMemo() # LRU of resampled series / aggregates for the loaded dataset
+        self.fingerprint = None # Content fingerprint of self.df, part of every memo key
+        self.source_path = None # CSV behind self.df; keys the cached climatology baselines
+        self.climatology = None # Day-of-year baselines of self.df, built on first use
+
+        # --- Background job state: one worker thread, results handed back through a queue ---
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.job_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.job = None # (on_done, on_error) of the running job, None when idle
+        self.action_buttons = [] # Disabled while a job runs so clicks cannot queue up
+        
+        # --- Custom TTK Style Configuration for Modern Look ---
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
+        
+        # General frame and label styles
+        self.style.configure('TFrame', background=BG_COLOR)
+        self.style.configure('TLabel', background=BG_COLOR, foreground=TEXT_COLOR, font=('Inter', 10))
+        
+        # Define a custom Primary button style
+        self.style.configure('Primary.TButton', 
+                             background=ACCENT_COLOR, 
+                             foreground='white', 
+                             font=('Inter', 10, 'bold'), 
+                             borderwidth=0, 
+                             relief='flat',
+                             padding=[15, 8]) # Increased padding for better touch target/look
+        self.style.map('Primary.TButton', 
+                       background=[('active', PRIMARY_COLOR), ('disabled', 'gray')],
+                       foreground=[('active', 'white')])
+
+        # Header style
+        self.style.configure('Header.TLabel', background=PRIMARY_COLOR, foreground='white', font=('Inter', 18, 'bold'))
+
+        # --- Generate Dummy Data for First Run ---
+        engine.create_dummy_data_file()
+
+        # --- Set up the Main GUI Layout ---
+        self._setup_layout(master)
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+    def _setup_layout(self, master):
+        """Sets up the main structure of the Tkinter window."""
+        
+        # 1. Header Frame (Top) - Uses darker PRIMARY_COLOR
+        header_frame = tk.Frame(master, bg=PRIMARY_COLOR, pady=15)
+        header_frame.pack(fill='x', side='top')
+        ttk.Label(header_frame, text=APP_TITLE, style='Header.TLabel').pack()
+
+        # 2. Control Panel (Left Sidebar)
+        control_panel = ttk.Frame(master, width=300)
+        control_panel.pack(side='left', fill='y', padx=10, pady=10)
+        
+        # Data Upload Section
+        data_frame = self._add_control_section(control_panel, "1. Data Management", 
+                                               self.load_data, "📁 Load CSV Dataset")
+        # Compact storage: int32 time offsets and int16/float32 values (about 3x less memory)
+        self.compact_mode = tk.BooleanVar(value=False)
+        ttk.Checkbutton(data_frame, text="Compact memory mode", variable=self.compact_mode).pack(anchor='w')
+        
+        self.status_label = ttk.Label(control_panel, text="Status: Ready", font=('Inter', 10, 'italic'), foreground=PRIMARY_COLOR)
+        self.status_label.pack(pady=(0, 5))
+
+        # Progress of the running background job, with a way to stop it
+        self.progress_bar = ttk.Progressbar(control_panel, mode='indeterminate', maximum=1.0)
+        self.progress_bar.pack(fill='x', padx=5)
+        self.cancel_button = ttk.Button(control_panel, text="✖ Cancel", command=self.cancel_job, state='disabled')
+        self.cancel_button.pack(pady=(5, 20))
+
+        # Analysis Section
+        analysis_frame = self._add_control_section(control_panel, "2. Time-Series Analysis")
+        # Apply new button style
+        self._action_button(analysis_frame, "📈 Calculate Period Averages", self.perform_time_series_analysis, pady=5)
+        self._action_button(analysis_frame, "🌍 Climatology & Anomalies", self.perform_climatology_analysis, pady=5)
+        
+        # Plotting Section (Now with 4 dedicated buttons)
+        plotting_frame = self._add_control_section(control_panel, "3. 📈 Visualization")
+        
+        ttk.Label(plotting_frame, text="Temperature Trends:", background=BG_COLOR, font=('Inter', 10, 'underline')).pack(fill='x', pady=(5, 0))
+        self._action_button(plotting_frame, "🌡️ Daily Temperature Avg",
+                            lambda: self._plot_single_trend('Temperature_C', 'Temperature', 'D'))
+        self._action_button(plotting_frame, "🌡️ Monthly Temperature Avg",
+                            lambda: self._plot_single_trend('Temperature_C', 'Temperature', 'M'))
+        
+        ttk.Label(plotting_frame, text="Humidity Trends:", background=BG_COLOR, font=('Inter', 10, 'underline')).pack(fill='x', pady=(10, 0))
+        self._action_button(plotting_frame, "💧 Daily Humidity Avg",
+                            lambda: self._plot_single_trend('Humidity_pct', 'Humidity', 'D'))
+        self._action_button(plotting_frame, "💧 Monthly Humidity Avg",
+                            lambda: self._plot_single_trend('Humidity_pct', 'Humidity', 'M'))
+
+
+        # Report Section
+        report_frame = self._add_control_section(control_panel, "4. Reporting", 
+                                                 self.save_report, f"💾 Save Report ({REPORT_FILENAME})")
+        self.write_companions = tk.BooleanVar(value=False)
+        ttk.Checkbutton(report_frame, text="Also save JSON + CSV data", variable=self.write_companions).pack(anchor='w')
+
+        # 3. Output Notebook (Right Main Area)
+        self.notebook = ttk.Notebook(master)
+        self.notebook.pack(side='right', fill='both', expand=True, padx=10, pady=10)
+
+        # Analysis Tab
+        self.analysis_frame = ttk.Frame(self.notebook, padding="15")
+        self.notebook.add(self.analysis_frame, text='📊 Analysis Results')
+        # Styling the ScrolledText for a clean, flat look
+        self.analysis_text = scrolledtext.ScrolledText(self.analysis_frame, wrap=tk.WORD, font=('Consolas', 10), bg='#FFFFFF', fg=TEXT_COLOR, padx=10, pady=10, relief=tk.FLAT)
+        self.analysis_text.pack(fill='both', expand=True)
+        
+        # --- Configure Text Tags for Attractive Report Output ---
+        self.analysis_text.tag_config('title_style', foreground=PRIMARY_COLOR, font=('Inter', 16, 'bold'))
+        self.analysis_text.tag_config('subtitle_style', foreground=ACCENT_COLOR, font=('Inter', 12, 'italic'))
+        self.analysis_text.tag_config('temp_metric', foreground='#E53935', font=('Consolas', 10, 'bold')) # Red for Temp
+        self.analysis_text.tag_config('humid_metric', foreground='#42A5F5', font=('Consolas', 10, 'bold')) # Blue for Humidity
+        self.analysis_text.tag_config('other_metric', foreground=TEXT_COLOR, font=('Consolas', 10, 'bold'))
+        self.analysis_text.tag_config('section_header', foreground=PRIMARY_COLOR, font=('Inter', 14, 'bold'), underline=1)
+
+
+        # Plotting Tab
+        self.plot_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.plot_frame, text='📈 Trend Plotting')
+        self._clear_plot() # Initialize plot area
+
+        # Diagnostics Tab
+        self._setup_diagnostics_tab()
+
+    def _setup_diagnostics_tab(self):
+        """Opt-in stage timings, tracemalloc peaks and cProfile capture."""
+        diag_frame = ttk.Frame(self.notebook, padding="15")
+        self.notebook.add(diag_frame, text='⏱ Diagnostics')
+
+        self.timings_var = tk.BooleanVar(value=TIMINGS.enabled)
+        self.trace_memory_var = tk.BooleanVar(value=TIMINGS.trace_memory)
+        self.profile_next_var = tk.BooleanVar(value=False)
+
+        options = ttk.Frame(diag_frame)
+        options.pack(fill='x')
+        ttk.Checkbutton(options, text="Record stage timings", variable=self.timings_var,
+                        command=lambda: setattr(TIMINGS, 'enabled', self.timings_var.get())).pack(side='left', padx=5)
+        ttk.Checkbutton(options, text="Trace memory (tracemalloc)", variable=self.trace_memory_var,
+                        command=lambda: TIMINGS.set_trace_memory(self.trace_memory_var.get())).pack(side='left', padx=5)
+        ttk.Checkbutton(options, text="cProfile next job", variable=self.profile_next_var).pack(side='left', padx=5)
+        ttk.Button(options, text="Save Memory Snapshot", command=self._save_memory_snapshot).pack(side='right', padx=5)
+        ttk.Button(options, text="Clear", command=self._clear_diagnostics).pack(side='right', padx=5)
+
+        self.last_job_label = ttk.Label(diag_frame, text="Last job: -", font=('Consolas', 10))
+        self.last_job_label.pack(fill='x', pady=(10, 5))
+        self.diag_text = scrolledtext.ScrolledText(diag_frame, wrap=tk.NONE, font=('Consolas', 10), bg='#FFFFFF', fg=TEXT_COLOR, padx=10, pady=10, relief=tk.FLAT)
+        self.diag_text.pack(fill='both', expand=True)
+
+    def _refresh_diagnostics(self, records_before=0):
+        """Shows the per-stage totals and the stages recorded by the job that just finished."""
+        if not TIMINGS.enabled:
+            return
+        new_records = len(TIMINGS.records) - records_before
+        self.last_job_label.config(text=f"Last job: {TIMINGS.describe(last=new_records) if new_records > 0 else '-'}")
+        self.diag_text.delete(1.0, tk.END)
+        self.diag_text.insert(tk.END, TIMINGS.table())
+
+    def _clear_diagnostics(self):
+        TIMINGS.clear()
+        self.last_job_label.config(text="Last job: -")
+        self.diag_text.delete(1.0, tk.END)
+
+    def _save_memory_snapshot(self):
+        filepath = filedialog.asksaveasfilename(defaultextension=".tracemalloc", initialfile="weather_memory.tracemalloc")
+        if not filepath:
+            return
+        try:
+            write_memory_snapshot(filepath)
+            self.status_label.config(text=f"Status: Memory snapshot saved to {os.path.basename(filepath)}")
+        except Exception as e:
+            messagebox.showerror("Diagnostics Error", f"Could not save memory snapshot: {e}")
+
+    def _add_control_section(self, parent, title, command=None, button_text=None):
+        """Helper to create section headers and buttons in the control panel."""
+        # Use subtle visual separation for sections
+        section_frame = ttk.Frame(parent, padding="10", relief=tk.GROOVE)
+        section_frame.pack(fill='x', pady=10, padx=5)
+        
+        # Section title with contrasting background for visibility
+        ttk.Label(section_frame, text=title, font=('Inter', 12, 'bold'), background=PRIMARY_COLOR, foreground='white', padding=5).pack(fill='x', pady=(0, 5))
+        
+        if command and button_text:
+            self._action_button(section_frame, button_text, command, pady=5)
+            
+        return section_frame
+
+    def _action_button(self, parent, text, command, pady=3):
+        """Creates a primary-style button that is disabled while a background job runs."""
+        button = ttk.Button(parent, text=text, command=command, style='Primary.TButton')
+        button.pack(fill='x', pady=pady)
+        self.action_buttons.append(button)
+        return button
+
+    # --- Background Jobs ---
+
+    def _run_job(self, status_text, work, on_done, on_error):
+        """
+        Runs work(progress, cancelled) on the worker thread so the Tk loop stays responsive.
+        on_done(result) / on_error(exception) are called back on the Tk loop; Tk widgets
+        must only be touched from there.
+        """
+        if self.job is not None:
+            return
+        self.job = (on_done, on_error, len(TIMINGS.records))
+        self.cancel_event.clear()
+        self._set_busy(True, status_text)
+
+        profile_path = None
+        if self.profile_next_var.get():
+            profile_path = f"weather_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof"
+            self.profile_next_var.set(False)
+
+        def report_progress(fraction):
+            self.job_queue.put(('progress', fraction))
+
+        def task():
+            try:
+                if profile_path:
+                    with profile_to(profile_path): # cProfile only sees the thread it runs in
+                        result = work(report_progress, self.cancel_event.is_set)
+                else:
+                    result = work(report_progress, self.cancel_event.is_set)
+                self.job_queue.put(('done', result))
+            except engine.Cancelled:
+                self.job_queue.put(('cancelled', None))
+            except Exception as e:
+                self.job_queue.put(('error', e))
+
+        self.executor.submit(task)
+        self.master.after(JOB_POLL_MS, self._poll_job)
+
+    def _poll_job(self):
+        """Drains the worker's queue; reschedules itself until the job finishes."""
+        try:
+            while True:
+                kind, payload = self.job_queue.get_nowait()
+                if kind == 'progress':
+                    if str(self.progress_bar['mode']) != 'determinate':
+                        self.progress_bar.stop()
+                        self.progress_bar.config(mode='determinate')
+                    self.progress_bar['value'] = payload
+                    continue
+
+                on_done, on_error, records_before = self.job
+                self.job = None
+                self._set_busy(False)
+                if kind == 'done':
+                    on_done(payload)
+                elif kind == 'error':
+                    on_error(payload)
+                else:
+                    self.status_label.config(text="Status: Cancelled.")
+                self._refresh_diagnostics(records_before)
+                return
+        except queue.Empty:
+            self.master.after(JOB_POLL_MS, self._poll_job)
+
+    def _set_busy(self, busy, status_text=None):
+        """Toggles buttons, the cancel button and the progress bar for a running job."""
+        for button in self.action_buttons:
+            button.config(state='disabled' if busy else 'normal')
+        self.cancel_button.config(state='normal' if busy else 'disabled')
+        if busy:
+            self.progress_bar.config(mode='indeterminate', value=0)
+            self.progress_bar.start(15)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate', value=0)
+        if status_text:
+            self.status_label.config(text=status_text)
+
+    def cancel_job(self):
+        """Asks the running job to stop at its next checkpoint."""
+        if self.job is not None:
+            self.cancel_event.set()
+            self.status_label.config(text="Status: Cancelling...")
+
+    def _on_close(self):
+        """Stops any running job before the window goes away."""
+        self.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
+
+    # --- Data Loading ---
+
+    def load_data(self):
+        """Handles file dialog and loads the CSV data into a pandas DataFrame."""
+        filepath = filedialog.askopenfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            initialfile=DUMMY_DATA_FILENAME
+        )
+        if not filepath:
+            return
+
+        self.report_content = []
+        load = engine.load_compact if self.compact_mode.get() else engine.load_dataframe
+
+        def work(progress, cancelled):
+            load_report = LoadReport()
+            df = load(filepath, cache=self.cache, progress=progress, cancelled=cancelled, load_report=load_report)
+            if cancelled():
+                raise engine.Cancelled()
+            return df, engine.WindowIndex(df), dataset_fingerprint(df), load_report
+
+        def on_done(result):
+            self.df, self.index, self.fingerprint, load_report = result
+            self.memo.invalidate() # Derived series of the previous dataset are no longer needed
+            self.max_date = self.df.index.max()
+            self.source_path = filepath
+            self.climatology = None
+            self.analysis_table = None
+            self.is_loaded = True
+
+            # Reset analysis view
+            self.analysis_text.delete(1.0, tk.END)
+            self.analysis_text.insert(tk.END, engine.describe_dataset(self.df, load_report))
+
+            self.status_label.config(text=f"Status: Data Loaded! ({len(self.df)} records, {self.cache.describe()})")
+            messagebox.showinfo("Success", f"Successfully loaded {len(self.df)} records from {os.path.basename(filepath)}.")
+
+        def on_error(e):
+            if isinstance(e, engine.DataError):
+                messagebox.showerror("Data Error", str(e))
+                self.status_label.config(text="Status: Ready")
+                return
+            messagebox.showerror("Error", f"Failed to load data:\n{e}")
+            self.df = None
+            self.index = None
+            self.is_loaded = False
+            self.status_label.config(text="Status: Loading Failed!")
+
+        self._run_job(f"Status: Loading {os.path.basename(filepath)}...", work, on_done, on_error)
+
+    # --- Core Analysis Functions (Enhanced for Attractive Text Output) ---
+
+    def perform_time_series_analysis(self):
+        """Calculates and displays averages for the last week, month, year, and decade, with rich formatting."""
+        if not self.is_loaded or self.df is None:
+            messagebox.showwarning("Warning", "Please load a dataset first!")
+            return
+
+        self._run_job("Status: Analyzing...",
+                      lambda progress, cancelled: engine.analyze_periods(self.df, self.max_date, index=self.index),
+                      self._show_analysis,
+                      lambda e: messagebox.showerror("Analysis Error", f"Could not analyze data: {e}"))
+
+    def _show_analysis(self, table):
+        """Renders the analysis summary table into the Analysis tab and restarts the report log."""
+        # Clear previous analysis
+        self.analysis_text.delete(1.0, tk.END)
+        self.notebook.select(0) # Switch to the analysis tab
+
+        # Title for the display using color tags
+        self.analysis_text.insert(tk.END, engine.ANALYSIS_TITLE + "\n", 'title_style')
+        reference_date = f"\nReference Date (End of Data): {self.max_date.strftime('%Y-%m-%d')}\n"
+        self.analysis_text.insert(tk.END, reference_date, 'subtitle_style')
+
+        for name, start, _, stats in engine.iter_windows(table):
+            header_text = f"\n\n--- {name} (from {start.strftime('%Y-%m-%d')}) ---\n"
+            self.analysis_text.insert(tk.END, header_text, 'section_header')
+
+            if stats is None:
+                self.analysis_text.insert(tk.END, "- Data not available for this period.\n")
+                continue
+            for column, text in engine.format_metric_lines(stats):
+                # Display with tags
+                self.analysis_text.insert(tk.END, text + "\n", METRIC_TAGS.get(column, 'other_metric'))
+
+        # Restart the report log with the Markdown version of this analysis
+        self.analysis_table = table
+        self.report_content = engine.analysis_markdown(table, self.max_date)
+        self.status_label.config(text="Status: Analysis Complete! (Rich Text Output)")
+
+    def perform_climatology_analysis(self):
+        """Compares recent months and the analysis periods with the day-of-year normals of the whole record."""
+        if not self.is_loaded or self.df is None:
+            messagebox.showwarning("Warning", "Please load a dataset first!")
+            return
+
+        def work(progress, cancelled):
+            # Baselines are built once per dataset (and reused from the cache entry across sessions)
+            baselines = self.climatology
+            if baselines is None:
+                baselines = build_climatology(self.df, cache=self.cache, filepath=self.source_path)
+            if cancelled():
+                raise engine.Cancelled()
+            return baselines, climatology_tables(baselines, self.df, self.max_date)
+
+        self._run_job("Status: Comparing with climatology...", work, self._show_climatology,
+                      lambda e: messagebox.showerror("Climatology Error", f"Could not compute climatology: {e}"))
+
+    def _show_climatology(self, result):
+        """Appends the anomaly tables to the Analysis tab and their Markdown version to the report log."""
+        baselines, tables = result
+        self.climatology = baselines
+        self.notebook.select(0)
+
+        self.analysis_text.insert(tk.END, "\n\nClimatology & Anomalies\n", 'title_style')
+        for column, lines in climatology_text(baselines, tables):
+            self.analysis_text.insert(tk.END, f"\n--- {lines[0]} ---\n", 'section_header')
+            self.analysis_text.insert(tk.END, "\n".join(lines[1:]) + "\n", METRIC_TAGS.get(column, 'other_metric'))
+        self.analysis_text.see(tk.END)
+
+        self.report_content.extend(climatology_markdown(baselines, tables))
+        self.status_label.config(text="Status: Climatology Complete!")
+
+    # --- Visualization Functions (Matplotlib) ---
+
+    def _clear_plot(self):
+        """Clears the plot area in the Plotting Tab."""
+        for widget in self.plot_frame.winfo_children():
+            widget.destroy()
+
+    def _display_plot(self, fig, plot_filename, y_label):
+        """Common logic to clear plot area, embed the (already saved) Matplotlib figure, and log to report."""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+        # 1. Clear previous plot
+        self._clear_plot()
+
+        # 2. Embed the Plot into Tkinter
+        with TIMINGS.stage('embed_canvas'):
+            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
+            # Zoom/pan toolbar; long series re-downsample to the visible range as the limits change
+            toolbar = NavigationToolbar2Tk(canvas, self.plot_frame, pack_toolbar=False)
+            toolbar.update()
+            toolbar.pack(side='bottom', fill='x')
+            canvas_widget = canvas.get_tk_widget()
+            canvas_widget.pack(fill='both', expand=True, padx=10, pady=10)
+            canvas.draw()
+
+        # 3. Log the image path to the report
+        self.report_content.append(engine.plot_markdown(y_label, plot_filename))
+        self.status_label.config(text=f"Status: Plot for {y_label} generated and saved as {plot_filename}! ({self.memo.describe()})")
+
+    def _plot_single_trend(self, column_name, y_label, frequency_code):
+        """
+        Generates a single line plot for a specific column at a given frequency.
+        frequency_code: 'D' for Daily, 'M' for Monthly.
+        """
+        if not self.is_loaded or self.df is None:
+            messagebox.showwarning("Warning", "Please load a dataset first!")
+            return
+
+        if column_name not in self.df.columns:
+            messagebox.showerror("Error", f"Column '{column_name}' not found for plotting.")
+            return
+
+        self.notebook.select(1) # Switch to the plotting tab
+
+        def work(progress, cancelled):
+            # 1. Prepare Time-Series Data (Pandas Resampling)
+            data_series = engine.resample_series(self.df, column_name, frequency_code,
+                                                 memo=self.memo, fingerprint=self.fingerprint)
+            if cancelled():
+                raise engine.Cancelled()
+
+            # 2. Build the styled figure and save it (needed for the report link) unless
+            #    an identical chart was already saved under its content-addressed name
+            fig = engine.plot_trend(data_series, y_label, frequency_code)
+            if cancelled():
+                raise engine.Cancelled()
+            key = engine.trend_plot_key(data_series, y_label, frequency_code)
+            plot_filename = engine.trend_plot_filename(column_name, frequency_code, key)
+            if not os.path.exists(plot_filename):
+                engine.save_figure(fig, plot_filename)
+            return fig, plot_filename
+
+        # 3. Display and Log (back on the Tk loop)
+        self._run_job(f"Status: Plotting {y_label}...", work,
+                      lambda result: self._display_plot(*result, engine.trend_title(y_label, frequency_code)),
+                      lambda e: messagebox.showerror("Plotting Error", f"Could not generate or save plot: {e}"))
+
+    # --- File Handling ---
+
+    def save_report(self):
+        """Saves the accumulated analysis content to a readable Markdown (.md) file."""
+        if not self.report_content or self.df is None:
+            messagebox.showwarning("Save Warning", "Please perform an analysis first!")
+            return
+
+        filepath = filedialog.asksaveasfilename(
+            defaultextension=".md",
+            initialfile=REPORT_FILENAME,
+            filetypes=[("Markdown Document", "*.md"), ("Compressed Markdown", "*.md.gz"), ("Text Document", "*.txt")]
+        )
+
+        if filepath:
+            try:
+                # The summary block reuses the period analysis; only without one is it computed here
+                table = self.analysis_table
+                if table is None:
+                    table = engine.analyze_periods(self.df, self.max_date, index=self.index)
+                companions = ('json', 'csv') if self.write_companions.get() else ()
+                engine.write_report(filepath, table, self.report_content, companions)
+
+                messagebox.showinfo("Success", f"Analysis report saved successfully to:\n{filepath}\n\nThis file is a Markdown (.md) document, which is easily readable in any text editor or browser. Note that plot images are saved separately in the same directory and linked in the report.")
+                self.status_label.config(text="Status: Report Saved!")
+
+            except Exception as e:
+                messagebox.showerror("Save Error", f"Could not save report: {e}")
+
+# --- Main Execution Block ---
+
+def run():
+    """Starts the Tkinter application (used by `python -m weather gui`)."""
+    try:
+        root = tk.Tk()
+        app = WeatherAnalyzerApp(root)
+        root.mainloop()
+    except Exception as e:
+        # Catch exceptions that might occur during setup (e.g., missing dependencies)
+        print(f"An unexpected error occurred during application startup: {e}")
+        messagebox.showerror("Startup Error", f"The application could not start. Ensure all libraries (pandas, numpy, matplotlib, tk) are installed.\nError: {e}")
+
+
+if __name__ == "__main__":
+    run()
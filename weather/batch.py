@@ -0,0 +1,116 @@
+"""
+Multi-station batch analysis.
+
+Each station CSV is loaded, cleaned and analyzed in its own worker process.
+Workers only send back the tidy summary table (never the DataFrame), so the
+parent does almost no work per station and throughput scales with the number of
+cores. Every station also gets its own Markdown report and, optionally, its
+trend charts; chart files are content-addressed, so re-running the batch only
+draws the charts whose data changed. A combined report (Markdown plus JSON/CSV
+companions) is streamed to disk by the parent as each station finishes.
+"""
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+SUMMARY_COLUMNS = ['station', 'window', 'start', 'end', 'column', 'stat', 'value']
+
+
+def find_station_files(source):
+    """Expands a directory (all *.csv inside it) or a glob pattern into a sorted list of files."""
+    if os.path.isdir(source):
+        source = os.path.join(source, '*.csv')
+    return sorted(glob.glob(source))
+
+
+def station_name(filepath):
+    """Station label used in the summary table and report filenames."""
+    return os.path.splitext(os.path.basename(filepath))[0]
+
+
+def _analyze_station(filepath, report_dir, chunksize, cache_dir, plot_dir=None, combined_dir=None):
+    """
+    Worker: load, clean and analyze one station.
+    Returns (station, tidy summary table, report sections for the combined report or None);
+    combined_dir is the combined report's directory, which its plot links are relative to.
+    """
+    from . import engine
+
+    station = station_name(filepath)
+    if plot_dir:
+        import matplotlib
+        matplotlib.use('Agg') # Workers never show a window
+        plot_dir = os.path.join(plot_dir, station)
+
+    cache = None
+    if cache_dir:
+        from .cache import DatasetCache
+        cache = DatasetCache(cache_dir)
+
+    report_path = os.path.join(report_dir, f"{station}.md") if report_dir else None
+    df, table, _, _ = engine.analyze_file(filepath, report_path=report_path, plot_dir=plot_dir,
+                                          chunksize=chunksize, cache=cache)
+
+    sections = None
+    if combined_dir is not None:
+        sections = engine.analysis_markdown(table, df.index.max())
+        if plot_dir:
+            # Charts already exist under their content-addressed names; this only relinks them
+            sections += engine.plot_sections(engine.export_trend_plots(df, plot_dir), combined_dir)
+    return station, table.assign(station=station)[SUMMARY_COLUMNS], sections
+
+
+def run_batch(source, workers=None, report_dir=None, chunksize=None, cache_dir=None, progress=None,
+              plot_dir=None, combined_report=None, companions=()):
+    """
+    Analyzes every station matched by source across a process pool.
+    workers: pool size (None = one per CPU).
+    plot_dir: optional directory; each station's trend charts go to plot_dir/<station>/.
+    combined_report: optional path of one report covering every station ('.gz' to compress),
+    written incrementally in completion order; companions: 'json' and/or 'csv' next to it.
+    progress: optional callable(done, total, station, error) called as each station finishes.
+    Returns (summary DataFrame with SUMMARY_COLUMNS, list of (filepath, error message)).
+    """
+    import pandas as pd
+    from .report import ReportWriter
+
+    files = find_station_files(source)
+    if report_dir:
+        os.makedirs(report_dir, exist_ok=True)
+    combined_dir = None
+    writer = None
+    if combined_report:
+        combined_dir = os.path.dirname(os.path.abspath(combined_report))
+        writer = ReportWriter(combined_report, companions)
+
+    tables, errors = [], []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_analyze_station, filepath, report_dir, chunksize, cache_dir, plot_dir,
+                            combined_dir): filepath
+                for filepath in files
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                filepath = futures[future]
+                error = None
+                try:
+                    station, table, sections = future.result()
+                    tables.append(table)
+                    if writer is not None:
+                        # Written and dropped right away: the parent never holds more than one station's text
+                        writer.write_dataset(table.drop(columns='station'), sections, name=station)
+                except Exception as e:
+                    error = str(e)
+                    errors.append((filepath, error))
+                if progress is not None:
+                    progress(done, len(files), station_name(filepath), error)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if not tables:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS), errors
+    # Stations sorted by name; window/column/stat order within a station is kept as produced
+    summary = pd.concat(tables, ignore_index=True).sort_values('station', kind='stable')
+    return summary.reset_index(drop=True), errors
@@ -0,0 +1,180 @@
+"""
+Benchmark harness.
+
+Generates synthetic station files (10^4 to 10^8 rows at daily, hourly or minute
+resolution, with optional gaps, NaNs and out-of-order rows) by reusing
+engine.synthetic_frame, then times every pipeline stage and records peak RSS.
+Each case runs in a fresh worker process so one case's memory peak does not
+hide the next one's. Results are written as JSON and/or CSV and can be compared
+against an earlier run to catch regressions.
+"""
+import csv
+import json
+import os
+import platform
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from . import engine
+from .streaming import load_daily_frame
+
+try:
+    import resource
+except ImportError: # Windows: peak RSS is not reported
+    resource = None
+
+RESOLUTIONS = {'D': 'D', 'h': 'h', 'min': 'min'}
+GENERATE_CHUNK_ROWS = 1_000_000
+# 'rows' is the requested size (the comparison key); 'rows_written' what survived gap removal
+RESULT_FIELDS = ['rows', 'rows_written', 'resolution', 'stage', 'seconds', 'peak_rss_mb']
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if platform.system() == 'Darwin' else peak / 1024
+
+
+def write_synthetic_csv(filepath, rows, resolution='D', gap_fraction=0.0, nan_fraction=0.0,
+                        shuffle_fraction=0.0, seed=0, chunk_rows=GENERATE_CHUNK_ROWS):
+    """
+    Writes a synthetic station CSV spanning `rows` timestamps at the given resolution.
+    gap_fraction: share of timestamps dropped (so the file has fewer rows than `rows`).
+    nan_fraction: share of temperature/humidity cells blanked out.
+    shuffle_fraction: share of rows swapped with a random row of the same chunk (out of order).
+    Generated and written chunk by chunk, so even 10^8 rows need little memory.
+    """
+    rng = np.random.default_rng(seed)
+    step = pd.Timedelta(1, unit=RESOLUTIONS[resolution])
+    start = pd.Timestamp('2000-01-01')
+    written = 0
+
+    with open(filepath, 'w', newline='') as f:
+        for first in range(0, rows, chunk_rows):
+            count = min(chunk_rows, rows - first)
+            dates = pd.date_range(start + first * step, periods=count, freq=step)
+            chunk = engine.synthetic_frame(dates, rng=rng, day_offset=first * step / pd.Timedelta(days=1))
+
+            if gap_fraction:
+                chunk = chunk[rng.random(len(chunk)) >= gap_fraction]
+            if nan_fraction:
+                for col in ('Temperature_C', 'Humidity_pct'):
+                    chunk.loc[rng.random(len(chunk)) < nan_fraction, col] = np.nan
+            if shuffle_fraction and len(chunk) > 1:
+                moved = rng.choice(len(chunk), size=int(len(chunk) * shuffle_fraction), replace=False)
+                order = np.arange(len(chunk))
+                order[moved] = rng.permutation(order[moved])
+                chunk = chunk.iloc[order]
+
+            chunk.to_csv(f, index=False, header=(first == 0))
+            written += len(chunk)
+    return written
+
+
+def _timed(timings, stage, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    timings.append({'stage': stage, 'seconds': time.perf_counter() - start, 'peak_rss_mb': peak_rss_mb()})
+    return result
+
+
+def run_case(filepath, workdir):
+    """Times each pipeline stage on one file (runs inside a worker process)."""
+    timings = []
+    df = _timed(timings, 'load', engine.load_dataframe, filepath)
+    _timed(timings, 'load_streaming', load_daily_frame, filepath)
+    index = _timed(timings, 'index', engine.WindowIndex, df)
+    results = _timed(timings, 'analyze', engine.analyze_periods, df, index=index)
+    daily = _timed(timings, 'resample_D', engine.resample_series, df, 'Temperature_C', 'D')
+    _timed(timings, 'resample_M', engine.resample_series, df, 'Temperature_C', 'M')
+
+    def plot():
+        fig = engine.plot_trend(daily, 'Temperature', 'D')
+        engine.save_figure(fig, os.path.join(workdir, 'bench_plot.png'))
+    _timed(timings, 'plot', plot)
+
+    report_content = engine.analysis_markdown(results, df.index.max())
+    _timed(timings, 'report', engine.write_report, os.path.join(workdir, 'bench_report.md'), results, report_content)
+    return timings
+
+
+def run_benchmarks(sizes, resolutions=('D',), workdir=None, gap_fraction=0.0, nan_fraction=0.0,
+                   shuffle_fraction=0.0, seed=0, keep_files=False, progress=None):
+    """
+    Runs every (size, resolution) case and returns a list of result records (RESULT_FIELDS).
+    progress: optional callable(message) for status lines.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix='weather_bench_')
+    os.makedirs(workdir, exist_ok=True)
+    records = []
+
+    for resolution in resolutions:
+        for rows in sizes:
+            filepath = os.path.join(workdir, f"bench_{resolution}_{rows}.csv")
+            if progress is not None:
+                progress(f"Generating {rows} rows at '{resolution}' resolution...")
+            start = time.perf_counter()
+            written = write_synthetic_csv(filepath, rows, resolution, gap_fraction, nan_fraction,
+                                          shuffle_fraction, seed)
+            case = {'rows': rows, 'rows_written': written, 'resolution': resolution}
+            records.append({**case, 'stage': 'generate',
+                            'seconds': time.perf_counter() - start, 'peak_rss_mb': peak_rss_mb()})
+
+            if progress is not None:
+                progress(f"Timing pipeline on {written} rows...")
+            # Fresh process per case: ru_maxrss is a lifetime peak
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                timings = pool.submit(run_case, filepath, workdir).result()
+            records.extend({**case, **t} for t in timings)
+
+            if not keep_files:
+                os.remove(filepath)
+    return records
+
+
+def write_results(records, json_path=None, csv_path=None):
+    """Writes benchmark records as JSON (with environment metadata) and/or CSV."""
+    if json_path:
+        payload = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'results': records,
+        }
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+    if csv_path:
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+
+
+def compare_results(records, baseline_path, tolerance=0.2, min_seconds=0.01):
+    """
+    Compares records against a previous JSON run.
+    Returns (rows, resolution, stage, old_seconds, new_seconds) for every stage that got
+    more than `tolerance` slower; stages faster than min_seconds are ignored as noise.
+    """
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    old = {(r['rows'], r['resolution'], r['stage']): r['seconds'] for r in baseline}
+
+    regressions = []
+    for record in records:
+        key = (record['rows'], record['resolution'], record['stage'])
+        if key not in old or max(old[key], record['seconds']) < min_seconds:
+            continue
+        if record['seconds'] > old[key] * (1 + tolerance):
+            regressions.append((*key, old[key], record['seconds']))
+    return regressions
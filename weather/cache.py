@@ -0,0 +1,184 @@
+"""
+On-disk columnar cache of cleaned datasets.
+
+Each CSV gets one entry directory holding the cleaned, date-indexed, sorted frame
+as plain .npy arrays (the index plus one array per column, in its own dtype) and a
+meta.json with the source key (path, mtime, size, content hash). Re-opening an
+unchanged file memory-maps the arrays instead of re-parsing the CSV. Text columns
+(e.g. a station name) are stored as fixed-width unicode with a missing-value mask. Arrays
+derived from the data (e.g. climatology baselines) can be stored in the same
+entry as .npz files and are dropped with it when the CSV changes. NumPy's own
+format is used so the cache needs no optional dependency such as pyarrow.
+"""
+import hashlib
+import json
+import os
+import shutil
+import warnings
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = ".weather_cache"
+CACHE_VERSION = 2 # 2: one array per column instead of a single value matrix
+_HASH_BLOCK = 1 << 20
+
+
+def file_digest(filepath):
+    """BLAKE2b digest of the file contents, read in 1 MiB blocks."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """Caches cleaned DataFrames keyed by (path, mtime, size, content hash) and counts hits/misses."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_dir(self, filepath):
+        path_key = hashlib.blake2b(os.path.abspath(filepath).encode('utf-8'), digest_size=12).hexdigest()
+        return os.path.join(self.cache_dir, path_key)
+
+    def _read_meta(self, entry_dir):
+        try:
+            with open(os.path.join(entry_dir, 'meta.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('version') == CACHE_VERSION else None
+
+    def _is_fresh(self, entry_dir, meta, filepath, st):
+        """mtime+size match is trusted; otherwise the content hash decides (touch-only changes stay valid)."""
+        if meta['size'] != st.st_size:
+            return False
+        if meta['mtime_ns'] == st.st_mtime_ns:
+            return True
+        if meta['digest'] != file_digest(filepath):
+            return False
+        # Same bytes, new mtime: refresh the key so the next open takes the fast path
+        meta['mtime_ns'] = st.st_mtime_ns
+        self._write_meta(entry_dir, meta)
+        return True
+
+    def _write_meta(self, entry_dir, meta):
+        with open(os.path.join(entry_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def _read_frame(self, entry_dir, meta):
+        """Memory-maps the cached arrays; the DataFrame wraps the numeric ones without copying the values."""
+        index = np.load(os.path.join(entry_dir, 'index.npy'), mmap_mode='r')
+        columns = {}
+        for i, col in enumerate(meta['columns']):
+            values = np.load(os.path.join(entry_dir, f'col{i}.npy'), mmap_mode='r')
+            if col in meta['text_columns']:
+                missing = np.load(os.path.join(entry_dir, f'col{i}.missing.npy'))
+                values = pd.Series(np.asarray(values), dtype='str').mask(missing).array
+            columns[col] = values
+        return pd.DataFrame(columns, index=pd.DatetimeIndex(index, name=meta['index_name']),
+                            columns=meta['columns'], copy=False)
+
+    def _write_frame(self, entry_dir, df, meta):
+        """Writes into a temporary directory first, then swaps it in, so readers never see half an entry."""
+        tmp_dir = f"{entry_dir}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        np.save(os.path.join(tmp_dir, 'index.npy'), df.index.values)
+        # Files are named by position, so any column name is safe
+        for i, col in enumerate(df.columns):
+            if col in meta['text_columns']:
+                np.save(os.path.join(tmp_dir, f'col{i}.npy'), df[col].to_numpy(dtype=str, na_value=''))
+                np.save(os.path.join(tmp_dir, f'col{i}.missing.npy'), df[col].isna().to_numpy())
+            else:
+                np.save(os.path.join(tmp_dir, f'col{i}.npy'), df[col].to_numpy())
+        self._write_meta(tmp_dir, meta)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+
+    def load(self, filepath, loader, variant=None):
+        """
+        Returns the cleaned frame for filepath, from cache when the key is fresh.
+        loader: callable(filepath) -> DataFrame used on a miss (e.g. engine.load_dataframe).
+        variant: string naming the cleaning settings; an entry built with other settings is rebuilt.
+        """
+        st = os.stat(filepath)
+        entry_dir = self._entry_dir(filepath)
+        meta = self._read_meta(entry_dir)
+
+        if meta is not None and meta.get('variant') == variant and self._is_fresh(entry_dir, meta, filepath, st):
+            try:
+                df = self._read_frame(entry_dir, meta)
+                self.hits += 1
+                return df
+            except (OSError, ValueError):
+                pass # Corrupt entry: fall through and rebuild it
+
+        self.misses += 1
+        df = loader(filepath)
+
+        meta = {
+            'version': CACHE_VERSION,
+            'path': os.path.abspath(filepath),
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'digest': file_digest(filepath),
+            'index_name': df.index.name,
+            'columns': list(df.columns),
+            # NumPy dtypes are stored as they are; anything else (str, object) as text
+            'text_columns': [col for col in df.columns
+                             if not isinstance(df[col].dtype, np.dtype) or df[col].dtype.kind == 'O'],
+            'variant': variant,
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write_frame(entry_dir, df, meta)
+        except OSError as e:
+            warnings.warn(f"Could not write cache entry for '{filepath}': {e}", RuntimeWarning)
+        return df
+
+    def load_arrays(self, filepath, name, compute):
+        """
+        Returns derived arrays stored as <name>.npz in filepath's entry, computing them on a miss.
+        compute: callable() -> {key: ndarray} (no object arrays; files are read without pickle).
+        Only stored while the dataset itself is cached and fresh.
+        """
+        entry_dir = self._entry_dir(filepath)
+        meta = self._read_meta(entry_dir)
+        fresh = meta is not None and self._is_fresh(entry_dir, meta, filepath, os.stat(filepath))
+        path = os.path.join(entry_dir, f"{name}.npz")
+
+        if fresh:
+            try:
+                with np.load(path) as data:
+                    arrays = {key: data[key] for key in data.files}
+                self.hits += 1
+                return arrays
+            except (OSError, ValueError):
+                pass # Missing or corrupt: recompute
+
+        self.misses += 1
+        arrays = compute()
+        if fresh:
+            tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+            try:
+                np.savez(tmp_path, **arrays)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                warnings.warn(f"Could not write '{name}' for '{filepath}': {e}", RuntimeWarning)
+        return arrays
+
+    def clear(self):
+        """Deletes every cache entry."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stats(self):
+        """Hit/miss counters for status lines and logs."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def describe(self):
+        return f"cache {self.hits} hit(s) / {self.misses} miss(es)"
@@ -0,0 +1,286 @@
+"""
+Command line entry point.
+
+    python -m weather                      # start the Tkinter app
+    python -m weather analyze data.csv --report out.md [--plots DIR] [--chunksize ROWS]
+    python -m weather batch stations/ --workers 8 --reports reports/ --plots plots/ --summary summary.csv
+    python -m weather watch live_station.csv --interval 60
+    python -m weather query stations/ --where "Humidity_pct > 90 and Temperature_C > 30" --months jun-sep
+    python -m weather bench --rows 10000 1000000 --resolution D h --json bench.json
+
+Heavy imports (pandas, matplotlib, tkinter) happen inside the command handlers so
+that argument parsing and `--help` stay instant.
+"""
+import argparse
+import sys
+
+
+def _cmd_gui(args):
+    from .app import run
+    run()
+    return 0
+
+
+def _cmd_analyze(args):
+    from . import engine
+    from .dates import LoadReport
+
+    cache = None
+    if args.cache_dir:
+        from .cache import DatasetCache
+        cache = DatasetCache(args.cache_dir)
+
+    load_report = LoadReport()
+    try:
+        df, results, _, anomalies = engine.analyze_file(
+            args.csv, report_path=args.report, plot_dir=args.plots, chunksize=args.chunksize, cache=cache,
+            compact=args.compact, climatology=args.climatology, companions=args.companion or (),
+            date_format=args.date_format, duplicates=args.duplicates, load_report=load_report)
+    except (OSError, engine.DataError) as e:
+        print(f"Failed to analyze '{args.csv}': {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(engine.describe_dataset(df, load_report))
+        print()
+        print(engine.analysis_text(results, df.index.max()), end="")
+        if anomalies is not None:
+            from .climatology import climatology_text
+            for _, lines in climatology_text(*anomalies):
+                print()
+                print("\n".join(lines))
+    if args.report:
+        print(f"Report written to {args.report}")
+    if cache is not None:
+        print(f"Cache: {cache.describe()}")
+    return 0
+
+
+def _cmd_batch(args):
+    from .batch import run_batch
+
+    def progress(done, total, station, error):
+        status = f"FAILED: {error}" if error else "ok"
+        print(f"[{done}/{total}] {station}: {status}", file=sys.stderr)
+
+    summary, errors = run_batch(args.source, workers=args.workers, report_dir=args.reports,
+                                chunksize=args.chunksize, cache_dir=args.cache_dir,
+                                progress=None if args.quiet else progress, plot_dir=args.plots,
+                                combined_report=args.combined_report, companions=args.companion or ())
+    if args.summary:
+        summary.to_csv(args.summary, index=False)
+        print(f"Summary table written to {args.summary}")
+    else:
+        print(summary.to_string(index=False))
+    if errors:
+        print(f"{len(errors)} station(s) failed.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _cmd_query(args):
+    import pandas as pd
+
+    from . import engine
+    from .batch import find_station_files
+    from .query import QueryIndex, parse_months
+
+    cache = None
+    if args.cache_dir:
+        from .cache import DatasetCache
+        cache = DatasetCache(args.cache_dir)
+
+    index = QueryIndex()
+    files = [filepath for source in args.source for filepath in find_station_files(source)]
+    for filepath in files:
+        try:
+            index.add_file(filepath, cache=cache, compact=args.compact)
+        except (OSError, engine.DataError) as e:
+            print(f"Skipping '{filepath}': {e}", file=sys.stderr)
+    if not len(index):
+        print("No datasets to query.", file=sys.stderr)
+        return 1
+
+    try:
+        months = parse_months(args.months) if args.months else None
+        results = index.query(args.where or (), months=months, start=args.start, end=args.end,
+                              columns=args.columns, limit=args.limit)
+    except ValueError as e:
+        print(f"Invalid query: {e}", file=sys.stderr)
+        return 1
+
+    # Rows are written as each partition is scanned; nothing is collected first.
+    # Datasets may lack some columns, so every partition is aligned to one header.
+    columns = ['dataset'] + (args.columns or index.columns())
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name='Date')).to_csv(out)
+        for name, rows in results:
+            rows = rows.assign(dataset=name).reindex(columns=columns)
+            rows.to_csv(out, header=False, float_format='%g')
+    finally:
+        if args.output:
+            out.close()
+    if not args.quiet:
+        print(index.last_stats.describe(), file=sys.stderr)
+        if cache is not None:
+            print(f"Cache: {cache.describe()}", file=sys.stderr)
+    return 0
+
+
+def _cmd_watch(args):
+    from . import engine
+    from .incremental import watch
+
+    def on_update(analyzer, added):
+        print(f"+{added} row(s), {analyzer.rows_added} total")
+        print(engine.analysis_text(analyzer.results(), analyzer.max_date), flush=True)
+
+    try:
+        watch(args.csv, interval=args.interval, on_update=on_update)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_bench(args):
+    from .bench import compare_results, run_benchmarks, write_results
+
+    records = run_benchmarks(args.rows, args.resolution, workdir=args.workdir,
+                             gap_fraction=args.gaps, nan_fraction=args.nans,
+                             shuffle_fraction=args.shuffle, seed=args.seed, keep_files=args.keep,
+                             progress=lambda message: print(message, file=sys.stderr))
+    write_results(records, json_path=args.json, csv_path=args.csv)
+
+    for record in records:
+        rss = f"{record['peak_rss_mb']:.0f} MiB" if record['peak_rss_mb'] is not None else "n/a"
+        print(f"{record['resolution']:>3} {record['rows']:>11} {record['stage']:<15} "
+              f"{record['seconds']:9.4f} s  peak {rss}")
+
+    if args.compare:
+        regressions = compare_results(records, args.compare, tolerance=args.tolerance)
+        for rows, resolution, stage, old, new in regressions:
+            print(f"REGRESSION {resolution} {rows} {stage}: {old:.4f} s -> {new:.4f} s", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def build_parser():
+    """Builds the argparse parser for all subcommands."""
+    parser = argparse.ArgumentParser(prog="weather", description="Time-series weather data analysis.")
+    parser.add_argument("--timings", action="store_true", help="print per-stage timings to stderr")
+    parser.add_argument("--trace-memory", action="store_true", help="also record tracemalloc peaks per stage")
+    parser.add_argument("--profile", metavar="FILE", help="run under cProfile and dump the stats to FILE")
+    parser.add_argument("--memory-snapshot", metavar="FILE", help="dump a tracemalloc snapshot to FILE at exit")
+    sub = parser.add_subparsers(dest="command")
+
+    gui = sub.add_parser("gui", help="start the Tkinter application (default)")
+    gui.set_defaults(func=_cmd_gui)
+
+    analyze = sub.add_parser("analyze", help="analyze one CSV without a display")
+    analyze.add_argument("csv", help="CSV file with Date, Temperature_C and Humidity_pct columns")
+    analyze.add_argument("--report", help="write a Markdown report to this path (gzipped if it ends in .gz)")
+    analyze.add_argument("--companion", nargs="+", choices=["json", "csv"],
+                         help="also write the statistics as JSON and/or CSV next to the report")
+    analyze.add_argument("--plots", metavar="DIR", help="render the four trend plots into DIR")
+    analyze.add_argument("--chunksize", type=int, metavar="ROWS",
+                         help="stream the file in chunks of ROWS into daily aggregates (for very large files; "
+                              "no std or percentiles)")
+    analyze.add_argument("--climatology", action="store_true",
+                         help="add day-of-year normals: monthly anomalies and extreme-day counts")
+    analyze.add_argument("--compact", action="store_true",
+                         help="hold the data as int32 time offsets and int16/float32 values (about 3x less memory)")
+    analyze.add_argument("--cache-dir", metavar="DIR",
+                         help="reuse a columnar cache of the cleaned data in DIR (rebuilt when the CSV changes)")
+    analyze.add_argument("--date-format", metavar="FMT",
+                         help="strptime layout of the Date column, 'ISO8601' or 'mixed' (default: sniffed)")
+    analyze.add_argument("--duplicates", choices=["last", "first", "mean", "keep"], default="last",
+                         help="how to collapse rows with the same timestamp (default: last)")
+    analyze.add_argument("-q", "--quiet", action="store_true", help="do not print the analysis")
+    analyze.set_defaults(func=_cmd_analyze)
+
+    batch = sub.add_parser("batch", help="analyze many station CSVs in parallel")
+    batch.add_argument("source", help="directory of CSVs or a glob pattern such as 'data/*.csv'")
+    batch.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    batch.add_argument("--reports", metavar="DIR", help="write one Markdown report per station into DIR")
+    batch.add_argument("--combined-report", metavar="PATH",
+                       help="stream one report covering every station to PATH (gzipped if it ends in .gz)")
+    batch.add_argument("--companion", nargs="+", choices=["json", "csv"],
+                       help="also write the combined statistics as JSON and/or CSV next to the combined report")
+    batch.add_argument("--plots", metavar="DIR",
+                       help="render each station's trend charts into DIR/<station>/ (unchanged charts are skipped)")
+    batch.add_argument("--summary", metavar="CSV", help="write the station x period x metric table here")
+    batch.add_argument("--chunksize", type=int, metavar="ROWS", help="stream each file in chunks of ROWS")
+    batch.add_argument("--cache-dir", metavar="DIR", help="columnar cache directory shared by the workers")
+    batch.add_argument("-q", "--quiet", action="store_true", help="do not report per-station progress")
+    batch.set_defaults(func=_cmd_batch)
+
+    query = sub.add_parser("query", help="find matching rows across many datasets")
+    query.add_argument("source", nargs="+", help="CSV files, directories of CSVs or glob patterns")
+    query.add_argument("--where", help="ANDed conditions, e.g. 'Humidity_pct > 90 and Temperature_C > 30'")
+    query.add_argument("--months", help="months to search, e.g. '6-9', 'jun-sep' or '11-2'")
+    query.add_argument("--from", dest="start", metavar="DATE", help="first date to search")
+    query.add_argument("--to", dest="end", metavar="DATE", help="last date to search (inclusive; a date alone covers the whole day)")
+    query.add_argument("--columns", nargs="+", help="columns to output (default: all)")
+    query.add_argument("--limit", type=int, help="stop after this many rows")
+    query.add_argument("--output", metavar="CSV", help="write matching rows here instead of stdout")
+    query.add_argument("--compact", action="store_true", help="hold the datasets in compact int32/int16 form")
+    query.add_argument("--cache-dir", metavar="DIR",
+                       help="memory-map cached data and partition summaries from DIR (built on first use)")
+    query.add_argument("-q", "--quiet", action="store_true", help="do not print the scan statistics")
+    query.set_defaults(func=_cmd_query)
+
+    watch = sub.add_parser("watch", help="follow a growing CSV and update the period figures incrementally")
+    watch.add_argument("csv", help="CSV file that new rows are appended to")
+    watch.add_argument("--interval", type=float, default=5.0, help="seconds between polls (default: 5)")
+    watch.set_defaults(func=_cmd_watch)
+
+    bench = sub.add_parser("bench", help="time every pipeline stage on synthetic datasets")
+    bench.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="dataset sizes")
+    bench.add_argument("--resolution", nargs="+", default=["D"], choices=["D", "h", "min"],
+                       help="timestamp resolutions to generate")
+    bench.add_argument("--gaps", type=float, default=0.0, help="fraction of timestamps dropped")
+    bench.add_argument("--nans", type=float, default=0.0, help="fraction of values blanked out")
+    bench.add_argument("--shuffle", type=float, default=0.0, help="fraction of rows written out of order")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--workdir", metavar="DIR", help="where to write generated files (default: a temp dir)")
+    bench.add_argument("--keep", action="store_true", help="keep the generated CSV files")
+    bench.add_argument("--json", metavar="PATH", help="write results as JSON")
+    bench.add_argument("--csv", metavar="PATH", help="write results as CSV")
+    bench.add_argument("--compare", metavar="JSON", help="flag stages slower than this earlier run")
+    bench.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown for --compare (default: 0.2)")
+    bench.set_defaults(func=_cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    """Parses arguments and dispatches to a subcommand; returns the exit status."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    func = _cmd_gui if args.command is None else args.func
+
+    if not (args.timings or args.trace_memory or args.profile or args.memory_snapshot):
+        return func(args)
+    if args.command == "bench":
+        # Every bench stage runs in a worker process, so the parent would record nothing
+        parser.error("bench times its stages itself; --timings, --trace-memory, --profile and "
+                     "--memory-snapshot only see the parent process")
+
+    # Instrumented run: the recorder is always present (disabled) in the engine; this switches it on
+    from .instrument import TIMINGS, profile_to, write_memory_snapshot
+    TIMINGS.enabled = True
+    TIMINGS.set_trace_memory(args.trace_memory or bool(args.memory_snapshot))
+    try:
+        if args.profile:
+            with profile_to(args.profile):
+                status = func(args)
+            print(f"cProfile stats written to {args.profile}", file=sys.stderr)
+        else:
+            status = func(args)
+    finally:
+        print(TIMINGS.table(), file=sys.stderr)
+    if args.memory_snapshot:
+        write_memory_snapshot(args.memory_snapshot)
+        print(f"tracemalloc snapshot written to {args.memory_snapshot}", file=sys.stderr)
+    return status
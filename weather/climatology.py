@@ -0,0 +1,298 @@
+"""
+Climatology: day-of-year normals, percentile bands and anomalies.
+
+Baselines are built once per dataset from daily means. Every date maps to one of
+366 calendar slots (29 February has its own slot, so 1 March is slot 60 in every
+year). np.bincount collects per-slot counts, sums and squares in one pass each,
+and every slot pools the days within ±BASELINE_WINDOW_DAYS of it (wrapping
+around the new year), so ten years of data give about 150 values per normal.
+The percentile band is exact: the values are sorted by slot once, and each
+slot's pool is two or three contiguous runs of that array. The result is a handful of 366-entry arrays
+per column: the normal for any observation is one array index, and the anomalies
+of a whole series are a single fancy-indexing step.
+
+With a cache.DatasetCache the arrays are stored in the dataset's cache entry and
+disappear together with it when the CSV changes.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from .compact import CompactFrame
+from .engine import COLUMN_LABELS, analysis_periods
+from .summary import numeric_columns
+
+DAY_SLOTS = 366
+FEB_29_SLOT = 59
+BASELINE_WINDOW_DAYS = 7 # Days pooled on each side of a calendar day
+BAND_PERCENTILES = (10, 50, 90)
+STAT_NAMES = ['count', 'mean', 'std'] + [f'p{q}' for q in BAND_PERCENTILES]
+RECENT_MONTHS = 12
+CLIMATOLOGY_VERSION = 2 # Part of the cache name; bump when the baseline computation changes
+
+
+def day_slots(index):
+    """Calendar slot (0..365) of each timestamp; common years skip the 29 February slot."""
+    index = pd.DatetimeIndex(index)
+    day_of_year = index.dayofyear.to_numpy() - 1
+    return day_of_year + (~index.is_leap_year & (day_of_year >= FEB_29_SLOT))
+
+
+def daily_means(df, column):
+    """Daily mean series of one column; days without data are left out."""
+    if isinstance(df, CompactFrame):
+        table = df.daily(column)
+        return table['sum'] / table['count']
+    return df[column].resample('D').mean().dropna()
+
+
+def _pool(per_slot, window):
+    """Sums each slot's entries with those of the `window` slots on either side, wrapping around the year."""
+    padded = np.concatenate((per_slot[-window:], per_slot, per_slot[:window])) if window else per_slot
+    cumulative = np.cumsum(padded, axis=0)
+    cumulative = np.concatenate((np.zeros_like(cumulative[:1]), cumulative))
+    return cumulative[2 * window + 1:] - cumulative[:DAY_SLOTS]
+
+
+def _pooled_percentiles(slots, values, window, percentiles):
+    """Exact percentiles of the values within `window` slots of each slot (wrapping), shape (DAY_SLOTS, q)."""
+    order = np.argsort(slots, kind='stable')
+    by_slot = values[order]
+    bounds = np.searchsorted(slots[order], np.arange(DAY_SLOTS + 1))
+    band = np.full((DAY_SLOTS, len(percentiles)), np.nan)
+    for slot in range(DAY_SLOTS):
+        first, last = slot - window, slot + window + 1
+        runs = [(max(first, 0), min(last, DAY_SLOTS))]
+        if first < 0:
+            runs.append((DAY_SLOTS + first, DAY_SLOTS))
+        if last > DAY_SLOTS:
+            runs.append((0, last - DAY_SLOTS))
+        pooled = np.concatenate([by_slot[bounds[a]:bounds[b]] for a, b in runs])
+        if pooled.size:
+            band[slot] = np.percentile(pooled, percentiles)
+    return band
+
+
+class Climatology:
+    """Per-column day-of-year baselines (count, mean, std, percentile band) with O(1) lookups."""
+
+    def __init__(self, baselines, start, end, window=BASELINE_WINDOW_DAYS):
+        self.baselines = baselines # {column: {stat: array of DAY_SLOTS values}}
+        self.start = start
+        self.end = end
+        self.window = window
+        self.columns = list(baselines)
+
+    @classmethod
+    def build(cls, daily, window=BASELINE_WINDOW_DAYS):
+        """daily: {column: date-indexed series of daily means}."""
+        baselines = {}
+        starts, ends = [], []
+        for column, series in daily.items():
+            series = series.dropna()
+            if series.empty:
+                continue
+            starts.append(series.index.min())
+            ends.append(series.index.max())
+            slots = day_slots(series.index)
+            values = series.to_numpy(dtype=np.float64)
+
+            # 1. Per-slot count, sum and squares (centred on the column mean for a stable variance)
+            offset = values.mean()
+            centred = values - offset
+            count = _pool(np.bincount(slots, minlength=DAY_SLOTS).astype(np.float64), window)
+            total = _pool(np.bincount(slots, weights=centred, minlength=DAY_SLOTS), window)
+            squares = _pool(np.bincount(slots, weights=centred * centred, minlength=DAY_SLOTS), window)
+
+            stats = {}
+            with np.errstate(invalid='ignore', divide='ignore'):
+                stats['count'] = count
+                stats['mean'] = np.where(count > 0, offset + total / count, np.nan)
+                variance = (squares - total * total / count) / (count - 1)
+                stats['std'] = np.where(count > 1, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+            # 2. Exact percentile band over each slot's pool
+            band = _pooled_percentiles(slots, values, window, BAND_PERCENTILES)
+            for i, q in enumerate(BAND_PERCENTILES):
+                stats[f'p{q}'] = band[:, i]
+            baselines[column] = stats
+
+        start = min(starts) if starts else pd.NaT
+        end = max(ends) if ends else pd.NaT
+        return cls(baselines, start, end, window)
+
+    # --- Lookups ---
+
+    def normal(self, column, timestamp):
+        """Baseline statistics for one date: {stat: value}."""
+        slot = day_slots([timestamp])[0]
+        return {stat: float(values[slot]) for stat, values in self.baselines[column].items()}
+
+    def lookup(self, column, index):
+        """Baseline statistics for every date of an index: {stat: array}."""
+        slots = day_slots(index)
+        return {stat: values[slots] for stat, values in self.baselines[column].items()}
+
+    def anomalies(self, series, column=None):
+        """Observed minus normal mean for every value of a date-indexed series."""
+        column = series.name if column is None else column
+        normal = self.baselines[column]['mean'][day_slots(series.index)]
+        return pd.Series(series.to_numpy(dtype=np.float64) - normal, index=series.index, name=column)
+
+    # --- Cache round trip (plain arrays, no pickling) ---
+
+    def to_arrays(self):
+        arrays = {
+            'columns': np.array(self.columns, dtype=str),
+            'period': np.array([pd.Timestamp(self.start).value, pd.Timestamp(self.end).value], dtype=np.int64),
+            'window': np.array(self.window),
+        }
+        for i, column in enumerate(self.columns):
+            arrays[f'baseline_{i}'] = np.vstack([self.baselines[column][stat] for stat in STAT_NAMES])
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        baselines = {
+            str(column): dict(zip(STAT_NAMES, arrays[f'baseline_{i}']))
+            for i, column in enumerate(arrays['columns'])
+        }
+        start, end = (pd.Timestamp(int(value)) for value in arrays['period'])
+        return cls(baselines, start, end, int(arrays['window']))
+
+
+def build_climatology(df, columns=None, window=BASELINE_WINDOW_DAYS, cache=None, filepath=None):
+    """
+    Baselines for df's numeric columns (or the given ones).
+    cache/filepath: optional cache.DatasetCache and the CSV df was loaded from; the
+    baselines are then stored with the cached dataset and reused until the file changes.
+    """
+    columns = numeric_columns(df) if columns is None else list(columns)
+
+    def compute():
+        return Climatology.build({col: daily_means(df, col) for col in columns}, window).to_arrays()
+
+    if cache is None or filepath is None:
+        return Climatology.from_arrays(compute())
+    settings = repr((CLIMATOLOGY_VERSION, columns, window, BAND_PERCENTILES)).encode('utf-8')
+    name = f"climatology_{hashlib.blake2b(settings, digest_size=6).hexdigest()}"
+    return Climatology.from_arrays(cache.load_arrays(filepath, name, compute))
+
+
+# --- Anomaly tables ---
+
+MONTH_COLUMNS = ['month', 'days', 'mean', 'normal', 'anomaly', 'above_p90', 'below_p10']
+EXTREME_COLUMNS = ['period', 'start', 'days', 'anomaly', 'above_p90', 'below_p10']
+
+
+def _daily_frame(climatology, daily, column):
+    """Daily means joined with their normal, anomaly and band exceedances."""
+    daily = daily.dropna()
+    normal = climatology.lookup(column, daily.index)
+    values = daily.to_numpy(dtype=np.float64)
+    return pd.DataFrame({
+        'value': values,
+        'normal': normal['mean'],
+        'anomaly': values - normal['mean'],
+        'above': values > normal['p90'],
+        'below': values < normal['p10'],
+    }, index=daily.index)
+
+
+def monthly_anomalies(climatology, daily, column, months=RECENT_MONTHS):
+    """The last `months` calendar months with data, each compared with the normal for the same days."""
+    frame = _daily_frame(climatology, daily, column)
+    grouped = frame.groupby(frame.index.to_period('M'))
+    table = pd.DataFrame({
+        'days': grouped['value'].count(),
+        'mean': grouped['value'].mean(),
+        'normal': grouped['normal'].mean(),
+        'anomaly': grouped['anomaly'].mean(),
+        'above_p90': grouped['above'].sum(),
+        'below_p10': grouped['below'].sum(),
+    }).tail(months)
+    table.index = table.index.astype(str)
+    return table.rename_axis('month').reset_index()[MONTH_COLUMNS]
+
+
+def extreme_counts(climatology, daily, column, windows):
+    """Days above the P90 / below the P10 normal and the mean anomaly per window {name: (start, end)}."""
+    frame = _daily_frame(climatology, daily, column)
+    rows = []
+    for name, (start, end) in windows.items():
+        # Daily means sit at midnight; flooring keeps the window's first (partial) day like the period statistics do
+        part = frame.loc[pd.Timestamp(start).floor('D'):end]
+        rows.append((name, start, len(part), part['anomaly'].mean() if len(part) else np.nan,
+                     int(part['above'].sum()), int(part['below'].sum())))
+    return pd.DataFrame(rows, columns=EXTREME_COLUMNS)
+
+
+def climatology_tables(climatology, df, max_date=None, months=RECENT_MONTHS):
+    """[(column, monthly anomaly table, extreme-day table)] for every column with a baseline."""
+    if max_date is None:
+        max_date = df.index.max()
+    windows = {name: (start, max_date) for name, start in analysis_periods(max_date).items()}
+    tables = []
+    for column in climatology.columns:
+        daily = daily_means(df, column)
+        tables.append((column, monthly_anomalies(climatology, daily, column, months),
+                       extreme_counts(climatology, daily, column, windows)))
+    return tables
+
+
+# --- Rendering ---
+
+def _unit_suffix(unit):
+    return f" {unit}" if unit else ""
+
+
+def _baseline_note(climatology):
+    return (f"baseline {climatology.start.strftime('%Y-%m-%d')} to {climatology.end.strftime('%Y-%m-%d')}, "
+            f"±{climatology.window}-day window")
+
+
+def climatology_markdown(climatology, tables):
+    """Markdown report sections (one per column) for the anomaly and extreme-day tables."""
+    sections = []
+    for column, monthly, extremes in tables:
+        icon, label, unit = COLUMN_LABELS.get(column, ('•', column, ''))
+        lines = [
+            f"## {icon} {label} vs. Climatology ({_baseline_note(climatology)})",
+            "",
+            "| Month | Days | Mean | Normal | Anomaly | Days > P90 | Days < P10 |",
+            "|---|---:|---:|---:|---:|---:|---:|",
+        ]
+        lines.extend(
+            f"| {row.month} | {row.days} | {row.mean:.2f} | {row.normal:.2f} | {row.anomaly:+.2f} "
+            f"| {row.above_p90} | {row.below_p10} |"
+            for row in monthly.itertuples()
+        )
+        lines += ["", "**Extreme days by period** (daily mean above the P90 / below the P10 normal):"]
+        lines.extend(
+            f"- {row.period}: {row.above_p90} above P90, {row.below_p10} below P10 "
+            f"(mean anomaly {row.anomaly:+.2f}{_unit_suffix(unit)} over {row.days} days)"
+            for row in extremes.itertuples()
+        )
+        sections.append("\n".join(lines) + "\n")
+    return sections
+
+
+def climatology_text(climatology, tables):
+    """Plain-text lines per column: [(column, [lines])], used by the Analysis tab and the command line."""
+    blocks = []
+    for column, monthly, extremes in tables:
+        icon, label, unit = COLUMN_LABELS.get(column, ('•', column, ''))
+        lines = [f"{icon} {label} vs. normal ({_baseline_note(climatology)})",
+                 f"{'Month':<9}{'Days':>5}{'Mean':>9}{'Normal':>9}{'Anomaly':>9}{'>P90':>6}{'<P10':>6}"]
+        lines.extend(
+            f"{row.month:<9}{row.days:>5}{row.mean:>9.2f}{row.normal:>9.2f}{row.anomaly:>+9.2f}"
+            f"{row.above_p90:>6}{row.below_p10:>6}"
+            for row in monthly.itertuples()
+        )
+        lines.extend(
+            f"{row.period}: {row.above_p90} day(s) above P90, {row.below_p10} below P10, "
+            f"mean anomaly {row.anomaly:+.2f}{_unit_suffix(unit)}"
+            for row in extremes.itertuples()
+        )
+        blocks.append((column, lines))
+    return blocks
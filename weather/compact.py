@@ -0,0 +1,279 @@
+"""
+Compact in-memory storage for long histories.
+
+A pandas frame costs 8 bytes per row for the datetime64 index plus 8 per float64
+column. CompactFrame stores the timestamps as int32 offsets from an epoch (in
+the coarsest unit the data is aligned to: days, hours, minutes or seconds; the
+epoch is the first timestamp, so a daily series recorded at 20:42 still uses
+whole-day offsets) and
+each measurement column as int16 tenths when every value sits on the 0.1 grid
+(NaN becomes a sentinel), falling back to float32 otherwise. For the bundled
+datasets that is 8-10 bytes per row instead of 24-32.
+
+The analysis and plotting paths work on these arrays directly: window bounds
+are searchsorted on the int32 offsets, and resampling aggregates the rows day by
+day in fixed-size blocks. Only one decoded column (or block) exists at a time.
+"""
+import numpy as np
+import pandas as pd
+
+from .dates import collapse_sorted
+
+# (unit name, seconds per unit), coarsest first
+OFFSET_UNITS = (('D', 86400), ('h', 3600), ('min', 60), ('s', 1))
+CODE_SCALE = 10 # int16 codes are tenths
+CODE_NA = np.iinfo(np.int16).min # Sentinel for a missing value
+CODE_MAX = np.iinfo(np.int16).max
+BLOCK_ROWS = 1_000_000 # Rows decoded at a time while resampling
+_INT32 = np.iinfo(np.int32)
+_NS = 10**9 # Nanoseconds per second
+_AGGREGATES = ('mean', 'min', 'max', 'sum', 'count')
+
+
+def encode_values(values):
+    """int16 tenths when every finite value round-trips exactly, otherwise None."""
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    scaled = np.rint(values[finite] * CODE_SCALE)
+    if scaled.size and (np.abs(scaled).max() > CODE_MAX or (scaled / CODE_SCALE != values[finite]).any()):
+        return None
+    codes = np.full(values.shape, CODE_NA, dtype=np.int16)
+    codes[finite] = scaled
+    return codes
+
+
+def decode_values(codes, dtype=np.float64):
+    """Inverse of encode_values; code / 10 gives back exactly the value parsed from the CSV."""
+    values = codes / np.asarray(CODE_SCALE, dtype=dtype)
+    values[codes == CODE_NA] = np.nan
+    return values
+
+
+def _nanoseconds_since(index, epoch):
+    """Nanoseconds between epoch and each timestamp, as int64."""
+    return (index.values - epoch.to_datetime64()).astype('timedelta64[ns]').astype(np.int64)
+
+
+def _coarsest_unit(nanoseconds):
+    """Seconds per unit of the coarsest OFFSET_UNITS entry every delta is a multiple of (sub-second deltas floor to 1)."""
+    for _, size in OFFSET_UNITS:
+        if not (nanoseconds % (size * _NS)).any():
+            return size
+    return 1
+
+
+class CompactIndex:
+    """Read-only view of the int32 timestamp offsets with the DatetimeIndex calls the engine uses."""
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def __len__(self):
+        return len(self._frame.offsets)
+
+    def min(self):
+        return self._frame.timestamp(0) if len(self) else pd.NaT
+
+    def max(self):
+        return self._frame.timestamp(-1) if len(self) else pd.NaT
+
+    def searchsorted(self, timestamps, side='left'):
+        """
+        Row positions for the given timestamps, found on the int32 offsets (no datetime64 array is built).
+        A timestamp between grid points rounds up for side='left' and down for side='right', so an
+        inclusive end bound never takes in the next row.
+        """
+        offsets = self._frame.offsets_for(timestamps, round_up=side == 'left')
+        return np.searchsorted(self._frame.offsets, offsets, side=side)
+
+    def to_datetime_index(self, lo=0, hi=None):
+        """Materialized DatetimeIndex of rows lo:hi (8 bytes per row, so only for small slices)."""
+        offsets = self._frame.offsets[lo:hi].astype(np.int64) * self._frame.unit_seconds
+        return pd.DatetimeIndex(self._frame.epoch.to_datetime64() + offsets.astype('timedelta64[s]'), name='Date')
+
+
+class CompactFrame:
+    """
+    Sorted, date-indexed measurements in compact form.
+    epoch: pd.Timestamp at offset 0; unit_seconds: seconds per offset step.
+    offsets: int32 array; data: {column: int16 codes or float32 values}.
+    """
+
+    def __init__(self, epoch, unit_seconds, offsets, data):
+        self.epoch = epoch
+        self.unit_seconds = unit_seconds
+        self.offsets = offsets
+        self.data = data
+        self.columns = list(data)
+        self.index = CompactIndex(self)
+
+    # --- Construction ---
+
+    @classmethod
+    def from_frame(cls, df):
+        """Compacts a cleaned, date-indexed frame (numeric columns only)."""
+        return cls.from_chunks([df])
+
+    @classmethod
+    def from_chunks(cls, chunks, duplicates='keep'):
+        """
+        Compacts an iterable of cleaned, date-indexed frames without holding them all at once.
+        Rows without a timestamp are dropped; the result is sorted by time (stable).
+        duplicates: rule for repeated timestamps across all chunks (see dates.DUPLICATE_RULES).
+        """
+        epoch, unit, columns = None, None, None
+        offset_parts, value_parts = [], {}
+
+        for df in chunks:
+            df = df[df.index.notna()]
+            if df.empty:
+                continue
+            if epoch is None:
+                epoch = df.index.min()
+                columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col].dtype)]
+                unit = 86400
+                value_parts = {col: [] for col in columns}
+
+            # 1. Timestamps: refine the unit if this chunk needs a finer one, then store int32 offsets
+            nanoseconds = _nanoseconds_since(df.index, epoch)
+            chunk_unit = min(unit, _coarsest_unit(nanoseconds))
+            if chunk_unit < unit:
+                offset_parts = [cls._to_int32(part.astype(np.int64) * (unit // chunk_unit)) for part in offset_parts]
+                unit = chunk_unit
+            offset_parts.append(cls._to_int32(nanoseconds // (unit * _NS)))
+
+            # 2. Values: int16 tenths while every chunk fits, float32 from the first one that does not
+            for col in columns:
+                parts = value_parts[col]
+                values = df[col].to_numpy(dtype=np.float64)
+                codes = encode_values(values) if not parts or parts[0].dtype == np.int16 else None
+                if codes is None and parts and parts[0].dtype == np.int16:
+                    value_parts[col] = parts = [decode_values(part, np.float32) for part in parts]
+                parts.append(codes if codes is not None else values.astype(np.float32))
+
+        if epoch is None:
+            return cls(pd.Timestamp(0), 1, np.empty(0, dtype=np.int32), {})
+
+        # 3. One contiguous array each, sorted by time only when the chunks were not already in order
+        offsets = np.concatenate(offset_parts)
+        data = {col: np.concatenate(parts) for col, parts in value_parts.items()}
+        del offset_parts, value_parts
+        if len(offsets) > 1 and (offsets[1:] < offsets[:-1]).any():
+            order = np.argsort(offsets, kind='stable')
+            offsets = offsets[order]
+            data = {col: values[order] for col, values in data.items()}
+
+        # 4. Repeated timestamps; only a 'mean' needs the values decoded (and re-encoded)
+        if duplicates != 'keep' and len(offsets) > 1 and (offsets[1:] == offsets[:-1]).any():
+            if duplicates == 'mean':
+                data = {col: decode_values(v) if v.dtype == np.int16 else v.astype(np.float64)
+                        for col, v in data.items()}
+            offsets, data = collapse_sorted(offsets, data, duplicates)
+            if duplicates == 'mean':
+                data = {col: cls._encode(values) for col, values in data.items()}
+        return cls(epoch, unit, offsets, data)
+
+    @staticmethod
+    def _encode(values):
+        codes = encode_values(values)
+        return codes if codes is not None else values.astype(np.float32)
+
+    @staticmethod
+    def _to_int32(offsets):
+        if offsets.size and (offsets.min() < _INT32.min or offsets.max() > _INT32.max):
+            raise OverflowError("Time range too long for int32 offsets at this timestamp resolution.")
+        return offsets.astype(np.int32)
+
+    # --- Access ---
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def empty(self):
+        return len(self.offsets) == 0
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + sum(values.nbytes for values in self.data.values())
+
+    def timestamp(self, position):
+        return self.epoch + pd.Timedelta(seconds=int(self.offsets[position]) * self.unit_seconds)
+
+    def offsets_for(self, timestamps, round_up=True):
+        """Offsets (int64, may lie outside the int32 range) of the given timestamps, rounded up or down."""
+        nanoseconds = _nanoseconds_since(pd.DatetimeIndex(timestamps), self.epoch)
+        if round_up:
+            return -(-nanoseconds // (self.unit_seconds * _NS))
+        return nanoseconds // (self.unit_seconds * _NS)
+
+    def column(self, name, lo=0, hi=None, dtype=np.float64):
+        """
+        Values of rows lo:hi. A float32 column is returned as a view when dtype allows it;
+        int16 codes are decoded into a new array.
+        """
+        stored = self.data[name][lo:hi]
+        if stored.dtype == np.int16:
+            return decode_values(stored, dtype)
+        return stored if stored.dtype == dtype else stored.astype(dtype)
+
+    def to_frame(self, lo=0, hi=None, columns=None):
+        """Materialized pandas frame of rows lo:hi (float64 columns)."""
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({col: self.column(col, lo, hi) for col in columns},
+                            index=self.index.to_datetime_index(lo, hi))
+
+    # --- Aggregation ---
+
+    def daily(self, name):
+        """Per-day count/sum/min/max of one column, built BLOCK_ROWS rows at a time."""
+        # Calendar days counted from the epoch's midnight
+        first_day = self.epoch.floor('D')
+        shift = (self.epoch - first_day) // pd.Timedelta(seconds=1)
+        parts = []
+        for lo in range(0, len(self), BLOCK_ROWS):
+            values = self.column(name, lo, lo + BLOCK_ROWS)
+            days = (self.offsets[lo:lo + BLOCK_ROWS].astype(np.int64) * self.unit_seconds + shift) // 86400
+            valid = ~np.isnan(values)
+            days, values = days[valid], values[valid]
+            if days.size == 0:
+                continue
+            # Rows are sorted, so every day is one contiguous run
+            starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+            parts.append(pd.DataFrame({
+                'day': days[starts],
+                'count': np.diff(np.r_[starts, len(days)]),
+                'sum': np.add.reduceat(values, starts),
+                'min': np.minimum.reduceat(values, starts),
+                'max': np.maximum.reduceat(values, starts),
+            }))
+        if not parts:
+            return pd.DataFrame(columns=['count', 'sum', 'min', 'max'], index=pd.DatetimeIndex([], name='Date'))
+
+        # A day split across two blocks appears twice; merge those rows
+        table = pd.concat(parts, ignore_index=True).groupby('day', sort=True).agg(
+            {'count': 'sum', 'sum': 'sum', 'min': 'min', 'max': 'max'})
+        table.index = pd.DatetimeIndex(first_day.to_datetime64() + table.index.to_numpy().astype('timedelta64[D]'),
+                                       name='Date')
+        return table
+
+    def resample(self, name, rule, how='mean'):
+        """Resampled series of one column for daily or coarser rules, without materializing the rows."""
+        if how not in _AGGREGATES:
+            raise ValueError(f"Unsupported aggregation '{how}' for compact data.")
+        try:
+            too_fine = pd.tseries.frequencies.to_offset(rule).nanos < pd.Timedelta(days=1).value
+        except ValueError: # Calendar offsets (months, years) have no fixed length and are all coarser
+            too_fine = False
+        if too_fine:
+            raise ValueError(f"Compact data resamples to daily or coarser frequencies, not '{rule}'.")
+
+        table = self.daily(name).resample(rule).agg({'count': 'sum', 'sum': 'sum', 'min': 'min', 'max': 'max'})
+        if how in ('mean', 'min', 'max'): # Empty buckets are NaN (and dropped) for these, 0 for sum/count
+            table = table[table['count'] > 0]
+        if how == 'mean':
+            series = table['sum'] / table['count']
+        else:
+            series = table[how].astype(np.float64)
+        series.name = name
+        return series
@@ -0,0 +1,19 @@
+# --- Configuration & Constants ---
+# Shared between the headless engine and the Tkinter front-end, so neither has to
+# import the other just to agree on file names and colours.
+
+APP_TITLE = "☀️ Time-Series Weather Data Analyst 📊"
+WINDOW_SIZE = "1200x750"
+
+# --- New, more vibrant color palette ---
+BG_COLOR = "#F0F8FF"     # Alice Blue (Very light blue background)
+ACCENT_COLOR = "#42A5F5" # Primary Blue (Medium shade for buttons/highlights)
+PRIMARY_COLOR = "#1976D2" # Darker Blue (For headers/section titles)
+TEXT_COLOR = "#212121"   # Dark Gray (For general text)
+
+REPORT_FILENAME = "Weather_Analysis_Report.md"
+DUMMY_DATA_FILENAME = "sample_weather_5years.csv"
+
+# Columns every dataset must provide (source name -> internal name)
+REQUIRED_COLUMNS = {'Date': 'Date', 'Temperature_C': 'Temperature_C', 'Humidity_pct': 'Humidity_pct'}
+VALUE_COLUMNS = ['Temperature_C', 'Humidity_pct']
@@ -0,0 +1,193 @@
+"""
+Date parsing, ordering and duplicate handling at load time.
+
+pd.to_datetime without a format infers the layout and is slower than a parse
+with a known one. sniff_date_format() scores the candidate layouts on a small
+sample (head, tail and an even stride through the column) and the whole column
+is then parsed in one vectorized pass with the layout that reads most of it;
+ISO-shaped layouts go through pandas' ISO 8601 parser, which is faster than the
+generic strptime path. Rows the layout cannot read are counted as coerced. When
+a day-first layout and its month-first twin read the sample equally well the
+column is ambiguous and the caller has to name the format. Ordering is checked
+in O(n) and the frame is only sorted (stably, so "first"/"last" keep their file
+meaning) when the rows are out of order. Repeated timestamps are collapsed with
+a configurable rule.
+
+LoadReport collects the counts so the app and the command line can say what
+happened to the file.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+# Scored on a sample; ties that are not day/month twins go to the earlier layout
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M',
+    '%Y/%m/%d',
+    '%Y/%m/%d %H:%M:%S',
+    '%d/%m/%Y',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+    '%m/%d/%Y',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M',
+    '%d-%m-%Y',
+    '%d.%m.%Y',
+    '%Y%m%d',
+)
+ISO_FORMATS = frozenset(f for f in DATE_FORMATS if f.startswith('%Y-%m-%d')) # Parsed as 'ISO8601'
+SNIFF_ROWS = 200 # Sampled from each end of the column and strided through the middle
+SNIFF_MIN_SHARE = 0.5 # A layout must read at least this share of the sample
+DUPLICATE_RULES = ('last', 'first', 'mean', 'keep')
+DEFAULT_DUPLICATES = 'last' # A repeated timestamp is usually a re-sent or corrected reading
+_ISO_PREFIX = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+class LoadReport:
+    """What cleaning did to a file: rows read, dates coerced, rows dropped, duplicates collapsed."""
+
+    def __init__(self):
+        self.rows_read = 0
+        self.dates_coerced = 0 # Non-empty dates no layout could read (dropped)
+        self.rows_dropped = 0 # Every dropped row: bad/missing date or missing required value
+        self.duplicates_collapsed = 0
+        self.resorted = False
+        self.date_format = None
+        self.from_cache = False
+
+    @property
+    def rows_kept(self):
+        return self.rows_read - self.rows_dropped - self.duplicates_collapsed
+
+    def describe(self):
+        """One line per fact, e.g. for the load message."""
+        if self.from_cache:
+            return "Loaded from cache (cleaned when the cache entry was built)."
+        lines = [f"Date format: {self.date_format or 'n/a'}"]
+        if self.dates_coerced:
+            lines.append(f"Unreadable dates: {self.dates_coerced}")
+        if self.rows_dropped:
+            lines.append(f"Rows dropped: {self.rows_dropped}")
+        if self.duplicates_collapsed:
+            lines.append(f"Duplicate timestamps collapsed: {self.duplicates_collapsed}")
+        if self.resorted:
+            lines.append("Rows were out of order and have been sorted.")
+        return "\n".join(lines)
+
+
+def _sample(values, rows=SNIFF_ROWS):
+    values = values.dropna()
+    if len(values) > 3 * rows:
+        middle = values.iloc[rows:-rows]
+        values = pd.concat([values.iloc[:rows], middle.iloc[::len(middle) // rows], values.iloc[-rows:]])
+    return values
+
+
+def _twin(date_format):
+    """The layout with day and month swapped ('%d/%m/%Y' <-> '%m/%d/%Y')."""
+    return date_format.replace('%d', '\0').replace('%m', '%d').replace('\0', '%m')
+
+
+def sniff_date_format(values, formats=DATE_FORMATS):
+    """
+    strptime layout that reads the largest share of a sample of a date column, else
+    'ISO8601' when the sample looks ISO-like, else 'mixed' (per-element inference).
+    Raises ValueError when a day-first layout and its month-first twin fit equally well.
+    """
+    sample = _sample(pd.Series(values))
+    if sample.empty:
+        return 'ISO8601'
+    sample = sample.astype(str).str.strip()
+    read = {}
+    for date_format in formats:
+        read[date_format] = pd.to_datetime(sample, format=date_format, errors='coerce').notna().to_numpy()
+        if read[date_format].all() and _twin(date_format) not in formats:
+            break # Nothing later can beat it, and there is no twin to tie with
+    best = max(read, key=lambda date_format: read[date_format].sum()) # Ties go to the earlier layout
+    if read[best].mean() >= SNIFF_MIN_SHARE:
+        twin = _twin(best)
+        if twin in read and read[twin].sum() == read[best].sum():
+            example = sample[read[best] & read[twin]].iloc[0]
+            raise ValueError(f"Dates such as '{example}' read as both {best} and {twin}; "
+                             "name the layout with --date-format.")
+        return best
+    if sample.str.match(_ISO_PREFIX).mean() >= SNIFF_MIN_SHARE:
+        return 'ISO8601'
+    return 'mixed'
+
+
+def parse_dates(values, date_format=None):
+    """
+    Parses a date column in one vectorized pass.
+    date_format: strptime layout, 'ISO8601' or 'mixed'; sniffed from the column when None.
+    Returns (DatetimeIndex named 'Date', format used, number of non-empty values left as NaT).
+    Raises ValueError when a sniffed day/month order is ambiguous.
+    """
+    values = pd.Series(values).reset_index(drop=True)
+    if date_format is None:
+        date_format = sniff_date_format(values)
+    parser_format = 'ISO8601' if date_format in ISO_FORMATS else date_format
+    # Timestamps are nearly all distinct, so pandas' unique-value cache would only add a pass
+    parsed = pd.to_datetime(values, format=parser_format, errors='coerce', cache=False)
+    coerced = int((parsed.isna() & values.notna()).sum()) if parsed.hasnans else 0
+    return pd.DatetimeIndex(parsed, name='Date'), date_format, coerced
+
+
+def order_and_dedupe(df, duplicates=DEFAULT_DUPLICATES):
+    """
+    Sorts a date-indexed frame only when it is out of order, then collapses repeated
+    timestamps: 'last'/'first' keep that row in file order, 'mean' averages them
+    (NaN-aware; text columns keep their first value), 'keep' leaves them alone.
+    Returns (frame, whether it was sorted, rows collapsed).
+    """
+    if duplicates not in DUPLICATE_RULES:
+        raise ValueError(f"Unknown duplicate rule '{duplicates}' (choose from {', '.join(DUPLICATE_RULES)}).")
+
+    # 1. O(n) order check; the stable sort keeps duplicates in file order
+    resorted = not df.index.is_monotonic_increasing
+    if resorted:
+        df = df.sort_index(kind='stable')
+
+    # 2. On sorted data every duplicate sits next to its twin
+    dates = df.index.values
+    if duplicates == 'keep' or len(dates) < 2 or not (dates[1:] == dates[:-1]).any():
+        return df, resorted, 0
+    before = len(df)
+    if duplicates == 'mean':
+        rules = {col: 'mean' if pd.api.types.is_numeric_dtype(df[col].dtype) else 'first' for col in df.columns}
+        df = df.groupby(level=0, sort=False).agg(rules)
+    else:
+        df = df[~df.index.duplicated(keep=duplicates)]
+    return df, resorted, before - len(df)
+
+
+def collapse_sorted(keys, columns, duplicates=DEFAULT_DUPLICATES):
+    """
+    Array form of order_and_dedupe's step 2 for sorted integer keys (e.g. compact offsets).
+    columns: {name: float array}. Returns (keys, columns) with one entry per distinct key.
+    """
+    if duplicates == 'keep' or len(keys) < 2:
+        return keys, columns
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    if len(starts) == len(keys):
+        return keys, columns
+    if duplicates == 'first':
+        return keys[starts], {col: values[starts] for col, values in columns.items()}
+    if duplicates == 'last':
+        take = np.r_[starts[1:], len(keys)] - 1
+        return keys[take], {col: values[take] for col, values in columns.items()}
+    means = {}
+    for col, values in columns.items():
+        valid = ~np.isnan(values)
+        total = np.add.reduceat(np.where(valid, values, 0.0), starts)
+        count = np.add.reduceat(valid.astype(np.int64), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means[col] = np.where(count > 0, total / count, np.nan)
+    return keys[starts], means
@@ -0,0 +1,552 @@
+"""
+Headless analysis engine.
+
+Everything in here works without a display: no tkinter, no dialogs, and matplotlib
+is only imported when a figure is actually requested. The Tkinter app and the
+command line both drive these functions.
+"""
+import hashlib
+import os
+from datetime import datetime, timedelta
+from importlib import metadata
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    BG_COLOR, DUMMY_DATA_FILENAME, PRIMARY_COLOR, REQUIRED_COLUMNS, VALUE_COLUMNS,
+)
+from .compact import CompactFrame
+from .dates import DEFAULT_DUPLICATES, LoadReport, order_and_dedupe, parse_dates
+from .instrument import TIMINGS
+from .report import ReportWriter
+from .summary import DEFAULT_PERCENTILES, OVERALL_WINDOW, iter_windows, summarize
+from .window_index import WindowIndex
+
+
+class DataError(ValueError):
+    """Raised when a dataset is missing required columns or cannot be analyzed."""
+
+
+class Cancelled(Exception):
+    """Raised inside a long-running operation when the caller asked it to stop."""
+
+
+LOAD_CHUNKSIZE = 200_000 # Rows per progress/cancellation checkpoint while loading
+
+
+# --- Data Generation and Loading ---
+
+def create_dummy_data_file(filename=DUMMY_DATA_FILENAME):
+    """Generates a large, synthetic weather dataset (5 years) for robust testing."""
+    if os.path.exists(filename):
+        print(f"Dummy file '{filename}' already exists.")
+        return
+
+    print(f"Generating large dummy data file: {filename}...")
+
+    start_date = datetime.now() - timedelta(days=5 * 365) # 5 years ago
+    end_date = datetime.now()
+    dates = pd.to_datetime(pd.date_range(start=start_date, end=end_date, freq='D'))
+
+    synthetic_frame(dates).to_csv(filename, index=False)
+    print(f"Successfully created {len(dates)} records in '{filename}'.")
+
+
+def synthetic_frame(dates, rng=np.random, day_offset=0.0):
+    """
+    Synthetic weather observations for the given timestamps (any resolution).
+    rng: numpy RandomState/Generator-like source of noise.
+    day_offset: elapsed days at dates[0], so consecutive chunks continue the same seasonal curve.
+    """
+    # Elapsed days drive the seasonal curves, so hourly/minute data gets a daily-consistent season
+    days = day_offset + (dates - dates[0]) / pd.Timedelta(days=1)
+    days = np.asarray(days, dtype=np.float64)
+
+    # Use seasonal sine wave for temperature to make data realistic
+    temp_base = 15 + 10 * np.sin(2 * np.pi * days / 365.25)
+    temp_noise = rng.normal(loc=0, scale=3, size=len(dates))
+
+    # Use inverse wave for humidity
+    humidity_base = 70 + 15 * np.cos(2 * np.pi * days / 365.25)
+    humidity_noise = rng.normal(loc=0, scale=5, size=len(dates))
+
+    data = {
+        'Date': dates,
+        # Temperature in Celsius: Base (seasonal) + Noise
+        'Temperature_C': (temp_base + temp_noise).round(1),
+        # Humidity Percentage: Base (seasonal) + Noise
+        'Humidity_pct': np.clip((humidity_base + humidity_noise).round(1), 30, 100),
+        # Wind Speed in km/h
+        'WindSpeed_kmh': rng.uniform(2, 40, len(dates)).round(1)
+    }
+    return pd.DataFrame(data)
+
+
+def _iter_csv_chunks(filepath, progress=None, cancelled=None):
+    """Yields raw chunks of LOAD_CHUNKSIZE rows, checking for cancellation and reporting progress."""
+    total = max(os.path.getsize(filepath), 1)
+    with open(filepath, 'rb') as f:
+        for chunk in pd.read_csv(f, chunksize=LOAD_CHUNKSIZE):
+            if cancelled is not None and cancelled():
+                raise Cancelled()
+            yield chunk
+            if progress is not None:
+                progress(min(f.tell() / total, 1.0))
+
+
+def _read_csv(filepath, progress=None, cancelled=None):
+    """Reads the CSV in one go, or in chunks when the caller wants progress or cancellation."""
+    if progress is None and cancelled is None:
+        return pd.read_csv(filepath)
+
+    chunks = list(_iter_csv_chunks(filepath, progress, cancelled))
+    if not chunks:
+        return pd.read_csv(filepath, nrows=0)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _cache_variant(date_format, duplicates):
+    """Cache entries are only reused when they were cleaned with the same settings."""
+    return f"dates={date_format or 'sniff'};duplicates={duplicates}"
+
+
+def load_dataframe(filepath, cache=None, progress=None, cancelled=None, date_format=None,
+                   duplicates=DEFAULT_DUPLICATES, load_report=None):
+    """
+    Loads a weather CSV into a cleaned, date-indexed and sorted DataFrame.
+    cache: optional cache.DatasetCache; an unchanged file is then memory-mapped instead of parsed.
+    progress: optional callable receiving the fraction of the file read so far.
+    cancelled: optional callable; when it returns True the load stops with Cancelled.
+    date_format/duplicates/load_report: see clean_frame().
+    """
+    if cache is not None:
+        if load_report is not None:
+            load_report.from_cache = True # Cleared again by clean_frame() on a miss
+        return cache.load(filepath, lambda path: load_dataframe(path, progress=progress, cancelled=cancelled,
+                                                                date_format=date_format, duplicates=duplicates,
+                                                                load_report=load_report),
+                          variant=_cache_variant(date_format, duplicates))
+
+    with TIMINGS.stage('read_csv'):
+        df_raw = _read_csv(filepath, progress, cancelled)
+    df = clean_frame(df_raw, date_format, duplicates, load_report)
+    del df_raw # The raw frame (with its object-dtype date strings) is not kept alongside the clean one
+
+    if df.empty:
+        raise DataError("File does not contain any usable records.")
+    return df
+
+
+def load_compact(filepath, cache=None, progress=None, cancelled=None, date_format=None,
+                 duplicates=DEFAULT_DUPLICATES, load_report=None):
+    """
+    Loads a weather CSV into a compact.CompactFrame (int32 time offsets, int16/float32 values).
+    The file is parsed and compacted chunk by chunk, so the full float64 frame never exists;
+    with a cache the memory-mapped frame is compacted instead. The date layout is sniffed
+    once from the first chunk; duplicates are collapsed across the whole file.
+    """
+    report = load_report if load_report is not None else LoadReport()
+
+    def clean_chunks():
+        for chunk in _iter_csv_chunks(filepath, progress, cancelled):
+            yield clean_frame(chunk, date_format or report.date_format, 'keep', report)
+
+    try:
+        if cache is not None:
+            frame = CompactFrame.from_frame(load_dataframe(filepath, cache, progress, cancelled,
+                                                           date_format, duplicates, load_report))
+        else:
+            with TIMINGS.stage('compact_load'):
+                frame = CompactFrame.from_chunks(clean_chunks(), duplicates)
+            report.duplicates_collapsed += report.rows_kept - len(frame)
+    except OverflowError as e:
+        raise DataError(str(e))
+
+    if frame.empty:
+        raise DataError("File does not contain any usable records.")
+    return frame
+
+
+def clean_frame(df_raw, date_format=None, duplicates=DEFAULT_DUPLICATES, load_report=None):
+    """
+    Validates columns, parses dates and returns the date-indexed, sorted frame without
+    incomplete rows or unreadable dates.
+    date_format: strptime layout, 'ISO8601' or 'mixed'; sniffed from the column when None.
+    duplicates: rule for repeated timestamps (dates.DUPLICATE_RULES).
+    load_report: optional dates.LoadReport the counts are added to.
+    """
+    # 1. Data Cleaning and Preprocessing (Pandas Core)
+    if not all(col in df_raw.columns for col in REQUIRED_COLUMNS.keys()):
+        raise DataError("File must contain 'Date', 'Temperature_C', and 'Humidity_pct' columns.")
+    report = load_report if load_report is not None else LoadReport()
+    report.from_cache = False
+    report.rows_read += len(df_raw)
+
+    df = df_raw.rename(columns=REQUIRED_COLUMNS)
+    for col in VALUE_COLUMNS:
+        # A stray token such as '--' turns the column into text; it becomes NaN and its row is dropped below
+        if not pd.api.types.is_numeric_dtype(df[col].dtype):
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    with TIMINGS.stage('to_datetime'):
+        # pop() releases the string column as soon as it is parsed
+        try:
+            df.index, report.date_format, coerced = parse_dates(df.pop('Date'), date_format)
+        except ValueError as e:
+            raise DataError(str(e))
+        report.dates_coerced += coerced
+    with TIMINGS.stage('dropna'):
+        before = len(df)
+        if df.index.hasnans:
+            df = df[df.index.notna()]
+        df.dropna(subset=['Temperature_C', 'Humidity_pct'], inplace=True)
+        report.rows_dropped += before - len(df)
+    with TIMINGS.stage('sort_index'):
+        # Sorted only when out of order; repeated timestamps collapsed per the rule
+        try:
+            df, resorted, collapsed = order_and_dedupe(df, duplicates)
+        except ValueError as e:
+            raise DataError(str(e))
+        report.resorted |= resorted
+        report.duplicates_collapsed += collapsed
+    return df
+
+
+def describe_dataset(df, load_report=None):
+    """One-line-per-fact description of a freshly loaded dataset (plus the cleaning counts, if given)."""
+    text = (
+        f"Data Loaded Successfully!\nTotal Records: {len(df)}\n"
+        f"Date Range: {df.index.min().strftime('%Y-%m-%d')} to {df.index.max().strftime('%Y-%m-%d')}"
+    )
+    if load_report is not None:
+        text += "\n" + load_report.describe()
+    return text
+
+
+# --- Core Analysis Functions ---
+
+ANALYSIS_TITLE = "Comprehensive Time-Series Analysis Report"
+
+
+# Trailing windows reported by the analysis, as offsets back from the last data point
+ANALYSIS_PERIODS = {
+    "Last 7 Days (Week)": pd.Timedelta(days=7),
+    "Last 30 Days (Month)": pd.Timedelta(days=30),
+    "Last Year": pd.DateOffset(years=1),
+    "Last Decade": pd.DateOffset(years=10)
+}
+
+
+def analysis_periods(max_date):
+    """Defines time periods relative to the last data point (max_date)."""
+    return {name: max_date - offset for name, offset in ANALYSIS_PERIODS.items()}
+
+
+@TIMINGS.timed('analyze')
+def analyze_periods(df, max_date=None, columns=None, percentiles=DEFAULT_PERCENTILES, index=None):
+    """
+    Calculates mean/min/max/std/count and percentiles for the last week, month, year,
+    and decade, plus the entire record (OVERALL_WINDOW), over every numeric column (or
+    the given columns) in one vectorized pass.
+    index: the dataset's WindowIndex, if one was built at load; the non-percentile
+    statistics are then O(log n) lookups per period.
+    Returns the tidy summary table (summary.TABLE_COLUMNS) the text view and report render from.
+    """
+    if max_date is None:
+        max_date = df.index.max()
+    return summarize(df, analysis_windows(df, max_date), columns=columns, percentiles=percentiles, index=index)
+
+
+def analysis_windows(df, max_date):
+    """{name: (start, end)} of the analysis periods ending at max_date, plus OVERALL_WINDOW."""
+    windows = {name: (start_date, max_date) for name, start_date in analysis_periods(max_date).items()}
+    windows[OVERALL_WINDOW] = (df.index.min(), max_date)
+    return windows
+
+
+# Display name, icon and unit per known column; other columns fall back to their raw name
+COLUMN_LABELS = {
+    'Temperature_C': ('🌡️', 'Temperature', '°C'),
+    'Humidity_pct': ('💧', 'Humidity', '%'),
+    'WindSpeed_kmh': ('🌬️', 'Wind Speed', 'km/h'),
+}
+
+
+def format_metric_line(column, stats):
+    """One metric line shared by the text view and the report, e.g. '🌡️ Avg Temperature: ...'."""
+    icon, label, unit = COLUMN_LABELS.get(column, ('•', column, ''))
+    unit = f" {unit}" if unit else ""
+    text = f"{icon} Avg {label}: {stats['mean']:.2f}{unit} (Min: {stats['min']:.1f} | Max: {stats['max']:.1f})"
+
+    # Spread details, when the summary provides them
+    details = []
+    if 'std' in stats and stats['std'] == stats['std']:
+        details.append(f"Std: {stats['std']:.2f}")
+    details.extend(f"P{stat[1:]}: {value:.1f}" for stat, value in stats.items()
+                   if stat.startswith('p') and value == value)
+    if 'count' in stats:
+        details.append(f"n={int(stats['count'])}")
+    if details:
+        text += f" [{' | '.join(details)}]"
+    return text
+
+
+def format_metric_lines(stats):
+    """(column, line) pairs for every column with data in one window's stats."""
+    return [(col, format_metric_line(col, col_stats)) for col, col_stats in stats.items()
+            if col_stats.get('count', 1) > 0]
+
+
+def analysis_markdown(table, max_date):
+    """Builds the Markdown report sections (one string per section) for an analysis run."""
+    sections = [f"# {ANALYSIS_TITLE}\nReference Date: {max_date.strftime('%Y-%m-%d')}\n"]
+    for name, start, _, stats in iter_windows(table):
+        if stats is None:
+            sections.append(f"## {name}\n- Data not available for this period.\n")
+            continue
+        lines = "".join(f"- {text}\n" for _, text in format_metric_lines(stats))
+        sections.append(f"## {name} (from {start.strftime('%Y-%m-%d')})\n{lines}")
+    return sections
+
+
+def analysis_text(table, max_date):
+    """Plain-text rendering of an analysis run, used by the command line."""
+    lines = [ANALYSIS_TITLE, f"Reference Date (End of Data): {max_date.strftime('%Y-%m-%d')}"]
+    for name, start, _, stats in iter_windows(table):
+        lines.append(f"\n--- {name} (from {start.strftime('%Y-%m-%d')}) ---")
+        if stats is None:
+            lines.append("- Data not available for this period.")
+        else:
+            lines.extend(text for _, text in format_metric_lines(stats))
+    return "\n".join(lines) + "\n"
+
+
+# --- Visualization Functions (Matplotlib, imported lazily) ---
+
+FREQUENCY_NAMES = {'D': "Daily", 'M': "Monthly"}
+SAVE_DPI = 150
+LOD_THRESHOLD = 2000 # Longer series are drawn through lod.LODLine
+PLOT_STYLE_VERSION = 1 # Bump when plot_trend's look changes so previously saved PNGs are re-rendered
+
+# (column, y label, frequency) of every trend chart in an exported chart set
+TREND_PLOTS = [
+    (column_name, y_label, frequency_code)
+    for column_name, y_label in (('Temperature_C', 'Temperature'), ('Humidity_pct', 'Humidity'))
+    for frequency_code in ('D', 'M')
+]
+
+
+def _resample_rule(frequency_code):
+    """Maps the app's 'D'/'M' codes onto the alias understood by the installed pandas."""
+    if frequency_code != 'M':
+        return frequency_code
+    try:
+        pd.tseries.frequencies.to_offset('ME')
+        return 'ME'
+    except ValueError: # pandas < 2.2 only knows 'M'
+        return 'M'
+
+
+def resample_series(df, column_name, frequency_code, how='mean', memo=None, fingerprint=None):
+    """
+    Resamples one column to the given frequency ('D' or 'M') and drops empty buckets.
+    memo/fingerprint: optional memo.SeriesMemo and the dataset's fingerprint; repeated
+    requests for the same series are then served from the memo.
+    """
+    if column_name not in df.columns:
+        raise DataError(f"Column '{column_name}' not found for plotting.")
+
+    def compute():
+        with TIMINGS.stage('resample'):
+            if isinstance(df, CompactFrame):
+                return df.resample(column_name, _resample_rule(frequency_code), how)
+            return getattr(df[column_name].resample(_resample_rule(frequency_code)), how)().dropna()
+
+    if memo is None or fingerprint is None:
+        return compute()
+    return memo.get_or_compute((fingerprint, column_name, frequency_code, how), compute)
+
+
+def trend_title(y_label, frequency_code):
+    """Title used both on the chart and in the report link."""
+    return f'{FREQUENCY_NAMES.get(frequency_code, "Monthly")} Average {y_label} Trend Analysis'
+
+
+def trend_style(y_label, frequency_code):
+    """Determine styling based on frequency and metric."""
+    if frequency_code == 'M':
+        line_color = '#E53935' if 'Temp' in y_label else PRIMARY_COLOR # Vivid Red / Dark Blue
+        return {'color': line_color, 'linewidth': 3, 'marker': 'o'}
+    # Daily
+    line_color = '#FFB74D' if 'Temp' in y_label else '#81D4FA' # Orange / Light Blue
+    return {'color': line_color, 'linewidth': 1.5, 'marker': None}
+
+
+@TIMINGS.timed('render_figure')
+def plot_trend(data_series, y_label, frequency_code, lod_method='minmax'):
+    """
+    Builds a Matplotlib figure for a single resampled series.
+    Uses matplotlib.figure.Figure directly so no pyplot backend (and no display) is needed.
+    Series longer than LOD_THRESHOLD are downsampled to the axes width (lod_method
+    'minmax' or 'lttb') and re-downsampled on zoom/pan.
+    """
+    from matplotlib.figure import Figure
+
+    freq_name = FREQUENCY_NAMES.get(frequency_code, "Monthly")
+    style = trend_style(y_label, frequency_code)
+    marker_style = style['marker']
+
+    # 1. Create the Matplotlib Figure (Color and Styling)
+    fig = Figure(figsize=(10, 5), facecolor=BG_COLOR)
+    fig.patch.set_alpha(0.8)
+    ax = fig.add_subplot()
+
+    # 2. Plot the data
+    line_kwargs = dict(label=f'{freq_name} Avg {y_label}',
+                       color=style['color'],
+                       linewidth=style['linewidth'],
+                       marker=marker_style,
+                       markersize=4 if marker_style else 0,
+                       markeredgecolor='white' if marker_style else style['color'])
+    if len(data_series) > LOD_THRESHOLD:
+        from .lod import LODLine
+        LODLine(ax, data_series.index.values, data_series.values,
+                method=lod_method, min_dpi=SAVE_DPI, **line_kwargs)
+    else:
+        ax.plot(data_series.index, data_series.values, **line_kwargs)
+
+    # 3. Aesthetic Enhancements
+    ax.set_title(trend_title(y_label, frequency_code),
+                 fontsize=15, color=PRIMARY_COLOR, fontweight='bold')
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel(f'Average {y_label}', fontsize=12)
+
+    ax.grid(True, linestyle='--', alpha=0.4)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    ax.tick_params(axis='x', rotation=45)
+    ax.legend(loc='best', frameon=True, shadow=True)
+    fig.tight_layout()
+    return fig
+
+
+def trend_plot_key(data_series, y_label, frequency_code, lod_method='minmax'):
+    """Content hash of everything a trend PNG depends on: the series values, its styling and the renderer."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(np.ascontiguousarray(data_series.index.values).view(np.uint8))
+    digest.update(np.ascontiguousarray(data_series.to_numpy(dtype=np.float64)).view(np.uint8))
+    settings = (y_label, frequency_code, lod_method, trend_title(y_label, frequency_code),
+                trend_style(y_label, frequency_code), SAVE_DPI, PLOT_STYLE_VERSION, metadata.version('matplotlib'))
+    digest.update(repr(settings).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def trend_plot_filename(column_name, frequency_code, key):
+    """Content-addressed PNG filename: the same data and styling always map to the same file."""
+    return f"trend_{frequency_code.lower()}_{column_name.lower()}_{key}.png"
+
+
+@TIMINGS.timed('savefig')
+def save_figure(fig, plot_filename):
+    """Saves the figure at report resolution; written to a temporary file and renamed into place."""
+    tmp_filename = f"{plot_filename}.{os.getpid()}.tmp"
+    fig.savefig(tmp_filename, format='png', bbox_inches='tight', dpi=SAVE_DPI) # Agg renderer, no GUI backend
+    os.replace(tmp_filename, plot_filename)
+
+
+def export_trend_plots(df, plot_dir, memo=None, fingerprint=None):
+    """
+    Renders every TREND_PLOTS chart of df into plot_dir.
+    Files are content-addressed, so a chart whose data and styling are unchanged is
+    found on disk and not drawn again.
+    Returns [(title, path, rendered)] in TREND_PLOTS order.
+    """
+    os.makedirs(plot_dir, exist_ok=True)
+    charts = []
+    for column_name, y_label, frequency_code in TREND_PLOTS:
+        if column_name not in df.columns:
+            continue
+        data_series = resample_series(df, column_name, frequency_code, memo=memo, fingerprint=fingerprint)
+        key = trend_plot_key(data_series, y_label, frequency_code)
+        path = os.path.join(plot_dir, trend_plot_filename(column_name, frequency_code, key))
+        rendered = not os.path.exists(path)
+        if rendered:
+            save_figure(plot_trend(data_series, y_label, frequency_code), path)
+        charts.append((trend_title(y_label, frequency_code), path, rendered))
+    return charts
+
+
+def plot_sections(charts, link_dir):
+    """
+    Report sections for export_trend_plots() results, linking each image relative to link_dir
+    (the report's directory), so a report can be moved together with its plots.
+    """
+    return [plot_markdown(title, os.path.relpath(path, link_dir).replace(os.sep, '/')) for title, path, _ in charts]
+
+
+def plot_markdown(y_label, plot_filename):
+    """Report section linking a saved plot image."""
+    markdown_link = f"![{y_label} Plot]({plot_filename})"
+    return f"\n---\n## Visualization: {y_label} Plot\n\n{markdown_link}\n"
+
+
+# --- File Handling ---
+
+@TIMINGS.timed('write_report')
+def write_report(filepath, table, report_content, companions=()):
+    """
+    Saves the accumulated analysis content to a readable Markdown (.md) file.
+    The summary block comes from the analysis table; companions ('json', 'csv') and a
+    '.gz' path are handled by report.ReportWriter.
+    """
+    with ReportWriter(filepath, companions) as writer:
+        writer.write_dataset(table, report_content)
+
+
+def analyze_file(filepath, report_path=None, plot_dir=None, chunksize=None, cache=None, compact=False,
+                 climatology=False, companions=(), date_format=None, duplicates=DEFAULT_DUPLICATES,
+                 load_report=None):
+    """
+    Runs the whole pipeline on one CSV: load, period analysis, optional climatology
+    anomaly sections, optional trend plots (all four column/frequency combinations)
+    and an optional Markdown report (with optional 'json'/'csv' companions).
+    With a chunksize the file is streamed into daily aggregates instead of loaded whole:
+    the summary has exact counts, means and extremes but no std or percentiles, and
+    df holds the daily means; with compact=True it is held as a compact.CompactFrame.
+    date_format/duplicates/load_report are passed to the loader (see clean_frame()).
+    Returns (df, summary table, report_content, anomalies); anomalies is
+    (Climatology, climatology_tables()) with climatology=True, else None.
+    """
+    if chunksize:
+        from .streaming import stream_daily_aggregates
+        aggregates = stream_daily_aggregates(filepath, chunksize=chunksize, date_format=date_format,
+                                             duplicates=duplicates, load_report=load_report)
+        df = aggregates.to_frame()
+        max_date = df.index.max()
+        table = aggregates.summarize(analysis_windows(df, max_date))
+    else:
+        if compact:
+            df = load_compact(filepath, cache, date_format=date_format, duplicates=duplicates,
+                              load_report=load_report)
+        else:
+            df = load_dataframe(filepath, cache, date_format=date_format, duplicates=duplicates,
+                                load_report=load_report)
+        max_date = df.index.max()
+        table = analyze_periods(df, max_date)
+    report_content = analysis_markdown(table, max_date)
+
+    anomalies = None
+    if climatology:
+        from .climatology import build_climatology, climatology_markdown, climatology_tables
+        baselines = build_climatology(df, cache=cache, filepath=filepath)
+        anomalies = (baselines, climatology_tables(baselines, df, max_date))
+        report_content.extend(climatology_markdown(*anomalies))
+
+    if plot_dir is not None:
+        link_dir = os.path.dirname(os.path.abspath(report_path)) if report_path else os.getcwd()
+        report_content.extend(plot_sections(export_trend_plots(df, plot_dir), link_dir))
+
+    if report_path is not None:
+        write_report(report_path, table, report_content, companions)
+    return df, table, report_content, anomalies
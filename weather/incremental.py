@@ -0,0 +1,231 @@
+"""
+Append-only incremental ingestion.
+
+IncrementalAnalyzer keeps one RollingWindow per analysis period (week, month,
+year, decade). New rows are pushed into every window and rows that fall out of
+a window are evicted from the front, so each update costs O(new rows)
+(amortized) instead of a reload plus full recompute. Min/max use monotonic
+deques; mean uses a running sum and count. The newest row is held back from the
+deques until a later timestamp arrives, so a re-sent or corrected reading of it
+can still be merged with the same duplicate rule a reload would apply.
+
+CsvTail remembers the byte offset it has read up to, so a growing CSV is parsed
+only from its new bytes.
+"""
+import io
+import os
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .config import VALUE_COLUMNS
+from .dates import DEFAULT_DUPLICATES, DUPLICATE_RULES, LoadReport
+from .engine import ANALYSIS_PERIODS, clean_frame
+from .summary import table_from_stats
+
+
+class RollingWindow:
+    """Trailing window of a fixed span with running sum/count and min/max deques per column."""
+
+    def __init__(self, name, span, columns):
+        self.name = name
+        self.span = span
+        self.columns = list(columns)
+        self.rows = deque() # (timestamp, values) in arrival (= time) order
+        self.sums = [0.0] * len(self.columns)
+        self.counts = [0] * len(self.columns)
+        self.mins = [deque() for _ in self.columns] # (timestamp, value), values increasing
+        self.maxs = [deque() for _ in self.columns] # (timestamp, value), values decreasing
+        self.tail = None # Newest (timestamp, values), not yet in rows/sums/deques
+        self.start = None
+
+    def push(self, timestamp, values):
+        """Adds one row; rows must arrive in non-decreasing timestamp order."""
+        if self.tail is not None:
+            self._commit(*self.tail)
+        self.tail = (timestamp, values)
+
+    def replace_last(self, values):
+        """Swaps the values of the newest row (a repeat of its timestamp was merged into it)."""
+        self.tail = (self.tail[0], values)
+
+    def _commit(self, timestamp, values):
+        self.rows.append((timestamp, values))
+        for i, value in enumerate(values):
+            if value != value: # NaN
+                continue
+            self.sums[i] += value
+            self.counts[i] += 1
+            mins, maxs = self.mins[i], self.maxs[i]
+            while mins and mins[-1][1] >= value:
+                mins.pop()
+            mins.append((timestamp, value))
+            while maxs and maxs[-1][1] <= value:
+                maxs.pop()
+            maxs.append((timestamp, value))
+
+    def advance(self, max_date):
+        """Evicts rows older than max_date - span (the window is inclusive of its start)."""
+        self.start = max_date - self.span
+        while self.rows and self.rows[0][0] < self.start:
+            _, values = self.rows.popleft()
+            for i, value in enumerate(values):
+                if value != value:
+                    continue
+                self.sums[i] -= value
+                self.counts[i] -= 1
+        for extremes in self.mins + self.maxs:
+            while extremes and extremes[0][0] < self.start:
+                extremes.popleft()
+
+    def stats(self):
+        """{column: {mean, min, max, count}}, or None when empty."""
+        if not self.rows and self.tail is None:
+            return None
+        stats = {}
+        for i, col in enumerate(self.columns):
+            total, count = self.sums[i], self.counts[i]
+            low = self.mins[i][0][1] if self.mins[i] else np.inf
+            high = self.maxs[i][0][1] if self.maxs[i] else -np.inf
+            value = self.tail[1][i] if self.tail is not None else np.nan
+            if value == value:
+                total, count = total + value, count + 1
+                low, high = min(low, value), max(high, value)
+            if count == 0:
+                stats[col] = {'mean': np.nan, 'min': np.nan, 'max': np.nan, 'count': 0}
+                continue
+            stats[col] = {'mean': total / count, 'min': low, 'max': high, 'count': count}
+        return stats
+
+
+class IncrementalAnalyzer:
+    """Period analysis that is updated in place as rows are appended."""
+
+    def __init__(self, columns=VALUE_COLUMNS, periods=ANALYSIS_PERIODS, duplicates=DEFAULT_DUPLICATES):
+        if duplicates not in DUPLICATE_RULES:
+            raise ValueError(f"Unknown duplicate rule '{duplicates}' (choose from {', '.join(DUPLICATE_RULES)}).")
+        self.columns = list(columns)
+        self.windows = [RollingWindow(name, span, self.columns) for name, span in periods.items()]
+        self.duplicates = duplicates # Rule for repeats of a timestamp, within and across appends
+        self.max_date = None
+        self.rows_added = 0
+        self.rows_collapsed = 0 # Repeats of the newest timestamp merged into it
+        self.rows_late = 0 # Rows older than max_date; an append-only feed should not produce these
+        self.date_format = None # Sniffed from the first raw rows, then reused for every later append
+        self._repeats = [] # Every row received for max_date, in arrival order
+
+    def _merge_repeat(self, row):
+        """Values of the newest timestamp after another row for it arrived, per the duplicate rule."""
+        self._repeats.append(row)
+        if self.duplicates == 'first':
+            return self._repeats[0]
+        if self.duplicates == 'last':
+            return row
+        rows = np.array(self._repeats)
+        valid = ~np.isnan(rows)
+        count = valid.sum(axis=0)
+        total = np.where(valid, rows, 0.0).sum(axis=0)
+        return tuple(np.where(count > 0, total / np.maximum(count, 1), np.nan).tolist())
+
+    def append(self, df):
+        """
+        Adds new rows. df is either a raw frame with a 'Date' column (cleaned here)
+        or an already cleaned, date-indexed frame. A repeat of the newest timestamp is
+        merged with the duplicate rule, so the figures match a reload of the whole file.
+        Returns the number of rows taken in (new timestamps plus merged repeats).
+        """
+        if not isinstance(df.index, pd.DatetimeIndex):
+            report = LoadReport()
+            # Repeats are merged below, where the rows of earlier appends are known too
+            df = clean_frame(df, date_format=self.date_format, duplicates='keep', load_report=report)
+            self.date_format = report.date_format
+        df = df[df.index.notna()].sort_index(kind='stable')
+        if df.empty:
+            return 0
+
+        timestamps = df.index
+        values = df[self.columns].to_numpy(dtype=np.float64)
+        added = collapsed = 0
+        for timestamp, row in zip(timestamps, values):
+            if self.max_date is not None and timestamp < self.max_date:
+                self.rows_late += 1
+                continue
+            row = tuple(row.tolist())
+            if timestamp == self.max_date and self.duplicates != 'keep':
+                merged = self._merge_repeat(row)
+                for window in self.windows:
+                    window.replace_last(merged)
+                collapsed += 1
+                continue
+            self._repeats = [row]
+            for window in self.windows:
+                window.push(timestamp, row)
+            self.max_date = timestamp
+            added += 1
+
+        for window in self.windows:
+            window.advance(self.max_date)
+        self.rows_added += added
+        self.rows_collapsed += collapsed
+        return added + collapsed
+
+    def results(self):
+        """Current period figures as a tidy summary table, like engine.analyze_periods (without std/percentiles)."""
+        return table_from_stats([(w.name, w.start, self.max_date, w.stats()) for w in self.windows])
+
+
+class CsvTail:
+    """Reads a growing CSV from the last byte offset; only complete lines are parsed."""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.offset = 0
+        self.header = None
+        self._partial = b''
+
+    def read_new(self):
+        """
+        Returns a raw DataFrame of the rows appended since the last call (None if nothing new).
+        If the file shrank (rotated or rewritten) reading restarts from the beginning.
+        """
+        size = os.path.getsize(self.filepath)
+        if size < self.offset:
+            self.offset, self.header, self._partial = 0, None, b''
+        if size == self.offset:
+            return None
+
+        with open(self.filepath, 'rb') as f:
+            f.seek(self.offset)
+            data = self._partial + f.read(size - self.offset)
+        self.offset = size
+
+        # Keep a trailing incomplete line for the next call
+        cut = data.rfind(b'\n') + 1
+        data, self._partial = data[:cut], data[cut:]
+        if not data:
+            return None
+        if self.header is None:
+            self.header, _, data = data.partition(b'\n')
+            if not data.strip():
+                return None
+        return pd.read_csv(io.BytesIO(self.header + b'\n' + data))
+
+
+def watch(filepath, analyzer=None, interval=5.0, on_update=None, should_stop=None):
+    """
+    Polls filepath every interval seconds and feeds new rows into the analyzer.
+    on_update(analyzer, added) is called after every poll that added rows.
+    should_stop: optional callable ending the loop when it returns True.
+    """
+    analyzer = analyzer if analyzer is not None else IncrementalAnalyzer()
+    tail = CsvTail(filepath)
+    while should_stop is None or not should_stop():
+        new_rows = tail.read_new()
+        if new_rows is not None and not new_rows.empty:
+            added = analyzer.append(new_rows)
+            if added and on_update is not None:
+                on_update(analyzer, added)
+        time.sleep(interval)
+    return analyzer
@@ -0,0 +1,138 @@
+"""
+Per-stage timing and memory instrumentation.
+
+Engine stages are wrapped in `with TIMINGS.stage('read_csv'):` blocks. While the
+recorder is disabled (the default) stage() hands back a shared no-op context
+manager, so the cost is one attribute check per stage. When enabled it records
+wall time per stage and, optionally, the tracemalloc peak reached inside it.
+profile_to() and write_memory_snapshot() capture cProfile / tracemalloc data to
+files for deeper digging.
+"""
+import cProfile
+import functools
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+_NO_OP = nullcontext()
+
+
+class _Stage:
+    """Context manager that times one stage and appends the result to its recorder."""
+
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        if self.recorder.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak() # Nested stages share the counter: the innermost peak wins
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        peak = None
+        if self.recorder.trace_memory and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+        self.recorder.record(self.name, seconds, peak)
+        return False
+
+
+class Instrumentation:
+    """Collects (stage, seconds, peak bytes) records; a no-op unless enabled."""
+
+    def __init__(self, enabled=False, trace_memory=False):
+        self.enabled = enabled
+        self.trace_memory = False
+        self.records = []
+        self._lock = threading.Lock()
+        if trace_memory:
+            self.set_trace_memory(True)
+
+    def stage(self, name):
+        """Context manager timing one pipeline stage."""
+        if not self.enabled:
+            return _NO_OP
+        return _Stage(self, name)
+
+    def timed(self, name):
+        """Decorator form of stage(); the enabled check happens per call."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Stage(self, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def record(self, name, seconds, peak_bytes=None):
+        with self._lock:
+            self.records.append((name, seconds, peak_bytes))
+
+    def set_trace_memory(self, on):
+        """Starts/stops tracemalloc alongside the timers (tracing slows Python code noticeably)."""
+        self.trace_memory = on
+        if on and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not on and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def clear(self):
+        with self._lock:
+            self.records = []
+
+    def summary(self):
+        """Per-stage totals in first-seen order: {stage: {'calls', 'seconds', 'peak_bytes'}}."""
+        totals = {}
+        with self._lock:
+            records = list(self.records)
+        for name, seconds, peak in records:
+            entry = totals.setdefault(name, {'calls': 0, 'seconds': 0.0, 'peak_bytes': None})
+            entry['calls'] += 1
+            entry['seconds'] += seconds
+            if peak is not None:
+                entry['peak_bytes'] = max(peak, entry['peak_bytes'] or 0)
+        return totals
+
+    def describe(self, last=None):
+        """Compact status line, e.g. 'read_csv 120.3 ms | to_datetime 31.0 ms'."""
+        with self._lock:
+            records = self.records[-last:] if last else list(self.records)
+        return " | ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds, _ in records)
+
+    def table(self):
+        """Multi-line table of the per-stage totals."""
+        lines = [f"{'Stage':<16}{'Calls':>7}{'Total ms':>12}{'Peak MiB':>11}"]
+        for name, entry in self.summary().items():
+            peak = f"{entry['peak_bytes'] / 2**20:.1f}" if entry['peak_bytes'] is not None else "-"
+            lines.append(f"{name:<16}{entry['calls']:>7}{entry['seconds'] * 1000:>12.1f}{peak:>11}")
+        return "\n".join(lines)
+
+
+# Process-wide recorder used by the engine and the app
+TIMINGS = Instrumentation()
+
+
+@contextmanager
+def profile_to(filepath):
+    """Runs the block under cProfile (current thread only) and dumps the stats to filepath."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(filepath)
+
+
+def write_memory_snapshot(filepath):
+    """Dumps the current tracemalloc snapshot (load it with tracemalloc.Snapshot.load)."""
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc is not tracing; enable memory tracing first.")
+    tracemalloc.take_snapshot().dump(filepath)
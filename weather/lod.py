@@ -0,0 +1,106 @@
+"""
+Level-of-detail rendering for long time series.
+
+A line with more points than the axes has pixels is mostly overdraw. LODLine
+keeps the full series in memory but only hands Matplotlib a downsampled copy of
+the visible range, sized to the axes width: min/max per bucket (the default,
+keeps every spike visible) or Largest-Triangle-Three-Buckets. The copy is
+recomputed whenever the x-limits change (zoom/pan) or the figure is resized, so
+redraw time stays roughly constant however long the history is.
+"""
+import numpy as np
+
+DEFAULT_MIN_DPI = 150 # Resolution of saved figures; buckets are sized so the PNG loses no detail
+
+
+def minmax_indices(y, lo, hi, n_buckets):
+    """Indices of the min and max of y in each of n_buckets equal slices of [lo, hi), plus both ends."""
+    n = hi - lo
+    if n <= 2 * n_buckets:
+        return np.arange(lo, hi)
+
+    per_bucket = int(np.ceil(n / n_buckets))
+    full = n // per_bucket * per_bucket
+    block = y[lo:lo + full].reshape(-1, per_bucket)
+    base = lo + np.arange(block.shape[0]) * per_bucket
+    picks = [base + block.argmin(axis=1), base + block.argmax(axis=1), np.array([lo, hi - 1])]
+
+    if full < n: # Ragged tail bucket
+        tail = y[lo + full:hi]
+        picks.append(lo + full + np.array([tail.argmin(), tail.argmax()]))
+
+    # Sorted and de-duplicated so the min/max of each bucket are drawn in time order
+    return np.unique(np.concatenate(picks))
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: n_out indices that best preserve the visual shape of (x, y)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    picks = [0]
+    a = 0
+    for i in range(len(edges) - 1):
+        start, end = edges[i], edges[i + 1]
+        if start >= end:
+            continue
+        # Average of the next bucket (the final point for the last bucket)
+        next_start, next_end = end, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picks.append(a)
+    picks.append(n - 1)
+    return np.asarray(picks)
+
+
+class LODLine:
+    """A Matplotlib line that re-downsamples its visible range on zoom, pan and resize."""
+
+    def __init__(self, ax, x, y, method='minmax', min_dpi=DEFAULT_MIN_DPI, **line_kwargs):
+        import matplotlib.dates as mdates
+
+        self.ax = ax
+        self.x = np.asarray(x)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.method = method
+        self.min_dpi = min_dpi
+        # Numeric x in Matplotlib's date units, for comparing against the axes limits
+        self._xnum = mdates.date2num(self.x) if np.issubdtype(self.x.dtype, np.datetime64) else self.x.astype(np.float64)
+
+        idx = self._indices(0, len(self.x))
+        (self.line,) = ax.plot(self.x[idx], self.y[idx], **line_kwargs)
+        ax.callbacks.connect('xlim_changed', lambda _ax: self.update())
+        ax.figure.canvas.mpl_connect('resize_event', lambda _event: self.update())
+
+    def _buckets(self):
+        """Horizontal resolution of the axes at the larger of the screen and save dpi."""
+        fig = self.ax.figure
+        width_in = self.ax.get_position().width * fig.get_figwidth()
+        return max(int(width_in * max(fig.dpi, self.min_dpi)), 16)
+
+    def _indices(self, lo, hi):
+        if self.method == 'lttb':
+            return lo + lttb_indices(self._xnum[lo:hi], self.y[lo:hi], 2 * self._buckets())
+        return minmax_indices(self.y, lo, hi, self._buckets())
+
+    def update(self):
+        """Recomputes the drawn points for the current x-limits."""
+        if len(self.x) == 0:
+            return
+        xmin, xmax = self.ax.get_xlim()
+        # One extra point on each side so the line runs to the edges of the axes
+        lo = max(int(np.searchsorted(self._xnum, xmin, side='left')) - 1, 0)
+        hi = min(int(np.searchsorted(self._xnum, xmax, side='right')) + 1, len(self.x))
+        if hi <= lo:
+            return
+        idx = self._indices(lo, hi)
+        self.line.set_data(self.x[idx], self.y[idx])
+
+    def point_count(self):
+        """Number of points currently handed to Matplotlib."""
+        return len(self.line.get_xdata())
@@ -0,0 +1,114 @@
+"""
+Memoization of derived series (resamples).
+
+Results are keyed on (dataset fingerprint, column, frequency, aggregation) and
+kept in a least-recently-used cache with a byte budget, so switching between
+the daily and monthly views of a large dataset only computes each one once.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .compact import CompactFrame
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def dataset_fingerprint(df):
+    """Content fingerprint of a loaded frame (index, column names and values); computed once per load."""
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(df, CompactFrame): # Hash the stored arrays as they are
+        digest.update(f"{df.epoch.value}:{df.unit_seconds}".encode('utf-8'))
+        digest.update(df.offsets.view(np.uint8))
+        for col, values in df.data.items():
+            digest.update(str(col).encode('utf-8'))
+            digest.update(values.view(np.uint8))
+        return digest.hexdigest()
+    digest.update(np.ascontiguousarray(df.index.values).view(np.uint8))
+    for col in df.columns:
+        digest.update(str(col).encode('utf-8'))
+        values = df[col].to_numpy()
+        if values.dtype == object:
+            digest.update(repr(values.tolist()).encode('utf-8'))
+        else:
+            digest.update(np.ascontiguousarray(values).view(np.uint8))
+    return digest.hexdigest()
+
+
+def _size_of(value):
+    """Approximate memory footprint of a cached result."""
+    if hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(index=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return sys.getsizeof(value)
+
+
+class SeriesMemo:
+    """Thread-safe LRU cache of derived results bounded by total size in bytes."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # key -> (value, size)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        """Returns the cached value for key, computing (and storing) it on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Computed outside the lock; a racing duplicate computation is harmless
+        value = compute()
+        size = _size_of(value)
+        with self._lock:
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (value, size)
+                self.current_bytes += size
+                self._evict()
+        return value
+
+    def _evict(self):
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def invalidate(self, fingerprint=None):
+        """Drops every entry, or only those belonging to one dataset fingerprint."""
+        with self._lock:
+            if fingerprint is None:
+                self._entries.clear()
+                self.current_bytes = 0
+                return
+            for key in [k for k in self._entries if k[0] == fingerprint]:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+    def stats(self):
+        """Hit/miss/size counters."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def describe(self):
+        stats = self.stats()
+        return (f"memo {stats['hits']} hit(s) / {stats['misses']} miss(es), "
+                f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB")
@@ -0,0 +1,320 @@
+"""
+Row queries across many datasets.
+
+QueryIndex registers loaded (or cached) datasets and cuts each one into
+year/month partitions: contiguous row ranges of the sorted frame, found with
+one searchsorted call on the month starts. Every partition keeps the min/max of
+each column in flat arrays shared by all datasets, so a query first prunes
+partitions with a few vectorized comparisons on those arrays: a partition whose
+month or dates fall outside the query, or whose [min, max] cannot satisfy one of
+the conditions, is never read. The surviving partitions are filtered with one
+boolean mask per condition and yielded one at a time, so a selective query
+touches only a small fraction of the rows (with a cache, only those pages of
+the memory-mapped arrays are read at all).
+
+Conditions are ANDed comparisons such as "Humidity_pct > 90 and Temperature_C > 30";
+a missing value never matches.
+"""
+import operator
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .compact import CompactFrame
+
+PARTITION_VERSION = 1 # Bump when the cached partition arrays change
+OPERATORS = {
+    '>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le,
+    '==': operator.eq, '=': operator.eq, '!=': operator.ne,
+}
+MONTH_NAMES = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+
+Condition = namedtuple('Condition', ['column', 'op', 'value'])
+
+_CONDITION = re.compile(r'^\s*(\w+)\s*(>=|<=|==|!=|=|>|<)\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*$')
+
+
+# --- Parsing ---
+
+def parse_where(text):
+    """Parses 'col > 1 and col2 <= 3' into a list of Conditions."""
+    conditions = []
+    for part in re.split(r'\s+and\s+', text.strip(), flags=re.IGNORECASE):
+        match = _CONDITION.match(part)
+        if match is None:
+            raise ValueError(f"Cannot parse condition '{part}' (expected e.g. 'Humidity_pct > 90').")
+        column, op, value = match.groups()
+        conditions.append(Condition(column, '==' if op == '=' else op, float(value)))
+    return conditions
+
+
+def _month_number(token):
+    token = token.strip().lower()
+    if token[:3] in MONTH_NAMES and not token.isdigit():
+        return MONTH_NAMES.index(token[:3]) + 1
+    month = int(token)
+    if not 1 <= month <= 12:
+        raise ValueError(f"Month out of range: {token}")
+    return month
+
+
+def parse_months(text):
+    """Parses '6-9', 'jun-sep,12' or '11-2' (wrapping past December) into a sorted list of months."""
+    months = set()
+    for part in text.split(','):
+        if '-' in part:
+            first, last = (_month_number(token) for token in part.split('-', 1))
+            span = (last - first) % 12 + 1
+            months.update((first - 1 + i) % 12 + 1 for i in range(span))
+        else:
+            months.add(_month_number(part))
+    return sorted(months)
+
+
+# --- Partitions ---
+
+def _values(frame, column, lo, hi):
+    """float64 values of rows lo:hi of a DataFrame or CompactFrame column."""
+    if isinstance(frame, CompactFrame):
+        return frame.column(column, lo, hi)
+    return frame[column].to_numpy()[lo:hi].astype(np.float64, copy=False)
+
+
+def _dates(frame, lo, hi):
+    if isinstance(frame, CompactFrame):
+        return frame.index.to_datetime_index(lo, hi)
+    return frame.index[lo:hi]
+
+
+def _columns(frame):
+    if isinstance(frame, CompactFrame):
+        return list(frame.columns)
+    return [col for col in frame.columns if pd.api.types.is_numeric_dtype(frame[col].dtype)]
+
+
+def _end_bound(end):
+    """Inclusive end timestamp; a date without a time of day covers that whole day."""
+    stamp = pd.Timestamp(end)
+    if isinstance(end, str) and ':' not in end and stamp == stamp.normalize():
+        stamp += pd.Timedelta(days=1) - pd.Timedelta(1, 'ns')
+    return stamp
+
+
+def _last_row(index, end):
+    """Rows up to and including end; an end finer than a DatetimeIndex's unit is rounded down to it."""
+    if isinstance(index, pd.DatetimeIndex):
+        end = end.as_unit(index.unit, round_ok=True)
+    return index.searchsorted([end], side='right')[0]
+
+
+def partition_arrays(frame):
+    """
+    Year/month partitions of a sorted frame as flat arrays:
+    'lo'/'hi' row ranges, 'month' (datetime64[M] as int64) and 'min_<col>'/'max_<col>' per column.
+    """
+    n = len(frame)
+    first, last = frame.index.min(), frame.index.max()
+    month_starts = pd.date_range(first.to_period('M').to_timestamp(), last, freq='MS')
+
+    # 1. Row ranges from the month starts; months without rows are dropped so every range is non-empty
+    lo = np.asarray(frame.index.searchsorted(month_starts, side='left'), dtype=np.int64)
+    hi = np.r_[lo[1:], n]
+    keep = hi > lo
+    lo, hi = lo[keep], hi[keep]
+    arrays = {
+        'lo': lo,
+        'hi': hi,
+        'month': month_starts.values.astype('datetime64[M]').astype(np.int64)[keep],
+    }
+
+    # 2. NaN-aware min/max per partition, one column at a time (all-NaN partitions stay NaN)
+    for col in _columns(frame):
+        values = _values(frame, col, 0, n)
+        with np.errstate(invalid='ignore'):
+            arrays[f'min_{col}'] = np.fmin.reduceat(values, lo)
+            arrays[f'max_{col}'] = np.fmax.reduceat(values, lo)
+    return arrays
+
+
+def _may_match(condition, mins, maxs):
+    """Partitions whose [min, max] admits at least one matching value (NaN bounds never match)."""
+    op, value = condition.op, condition.value
+    with np.errstate(invalid='ignore'):
+        if op in ('>', '>='):
+            return OPERATORS[op](maxs, value)
+        if op in ('<', '<='):
+            return OPERATORS[op](mins, value)
+        if op == '==':
+            return (mins <= value) & (maxs >= value)
+        return ~((mins == value) & (maxs == value)) & ~np.isnan(mins)
+
+
+class QueryStats:
+    """Counters of the last query: partitions total/scanned, rows read/matched."""
+
+    def __init__(self, partitions_total=0):
+        self.partitions_total = partitions_total
+        self.partitions_scanned = 0
+        self.rows_scanned = 0
+        self.rows_matched = 0
+
+    def describe(self):
+        return (f"{self.rows_matched} row(s) matched; scanned {self.partitions_scanned} of "
+                f"{self.partitions_total} partition(s), {self.rows_scanned} row(s) read")
+
+
+# --- Index ---
+
+class QueryIndex:
+    """Year/month-partitioned index over named datasets (DataFrames or CompactFrames)."""
+
+    def __init__(self):
+        self.names = []
+        self.frames = []
+        self._parts = [] # partition_arrays() per dataset
+        self._flat = None # Concatenated partitions, rebuilt after add()
+        self.last_stats = QueryStats()
+
+    def __len__(self):
+        return len(self.frames)
+
+    def add(self, name, frame, partitions=None):
+        """Registers a sorted, date-indexed frame; partitions: precomputed partition_arrays(frame)."""
+        if len(frame) == 0:
+            return
+        self.names.append(name)
+        self.frames.append(frame)
+        self._parts.append(partitions if partitions is not None else partition_arrays(frame))
+        self._flat = None
+
+    def add_file(self, filepath, name=None, cache=None, compact=False):
+        """
+        Loads and registers a CSV. With a cache.DatasetCache the frame is memory-mapped and the
+        partition arrays are stored next to it, so re-registering an unchanged file reads no rows.
+        """
+        from . import engine
+        from .batch import station_name
+
+        frame = engine.load_compact(filepath, cache) if compact else engine.load_dataframe(filepath, cache)
+        partitions = None
+        if cache is not None:
+            partitions = cache.load_arrays(filepath, f"query_partitions_v{PARTITION_VERSION}",
+                                           lambda: partition_arrays(frame))
+        self.add(name or station_name(filepath), frame, partitions)
+
+    def columns(self):
+        """Every column known to at least one dataset, in first-seen order."""
+        seen = {}
+        for frame in self.frames:
+            seen.update(dict.fromkeys(_columns(frame)))
+        return list(seen)
+
+    def _flatten(self):
+        """One array per field across all datasets, plus the owning dataset of each partition."""
+        if self._flat is None:
+            columns = self.columns()
+            sizes = [len(parts['lo']) for parts in self._parts]
+            flat = {
+                'dataset': np.repeat(np.arange(len(sizes)), sizes),
+                'lo': np.concatenate([parts['lo'] for parts in self._parts]) if sizes else np.empty(0, np.int64),
+                'hi': np.concatenate([parts['hi'] for parts in self._parts]) if sizes else np.empty(0, np.int64),
+                'month': np.concatenate([parts['month'] for parts in self._parts]) if sizes else np.empty(0, np.int64),
+            }
+            for col in columns:
+                for bound in ('min', 'max'):
+                    key = f'{bound}_{col}'
+                    flat[key] = np.concatenate(
+                        [parts.get(key, np.full(size, np.nan)) for parts, size in zip(self._parts, sizes)]
+                    ) if sizes else np.empty(0)
+            self._flat = flat
+        return self._flat
+
+    def prune(self, conditions=(), months=None, start=None, end=None, datasets=None):
+        """Positions (into the flat partition arrays) of the partitions a query has to read."""
+        flat = self._flatten()
+        keep = np.ones(len(flat['lo']), dtype=bool)
+        month = flat['month'].astype('datetime64[M]')
+        if months is not None:
+            keep &= np.isin(month.astype(np.int64) % 12 + 1, list(months))
+        if start is not None:
+            keep &= month >= np.datetime64(pd.Timestamp(start), 'M')
+        if end is not None:
+            keep &= month <= np.datetime64(pd.Timestamp(end), 'M')
+        if datasets is not None:
+            keep &= np.isin(flat['dataset'], [self.names.index(name) for name in datasets])
+        for condition in conditions:
+            keep &= _may_match(condition, flat[f'min_{condition.column}'], flat[f'max_{condition.column}'])
+        return np.flatnonzero(keep)
+
+    def query(self, where=(), months=None, start=None, end=None, datasets=None, columns=None, limit=None):
+        """
+        Lazily yields (dataset name, DataFrame of matching rows) per partition, in dataset then time order.
+        where: condition string or Conditions (ANDed); months: iterable of 1-12;
+        start/end: inclusive date bounds (a date-only end includes that whole day);
+        datasets: names to search (default all); columns: output columns (default each
+        dataset's numeric columns); limit: stop after this many rows.
+        Counters are kept in self.last_stats while the iterator is consumed.
+        """
+        conditions = parse_where(where) if isinstance(where, str) else list(where)
+        known = self.columns()
+        unknown = sorted(({c.column for c in conditions} | set(columns or ())) - set(known))
+        if unknown:
+            raise ValueError(f"Unknown column(s): {', '.join(unknown)} (available: {', '.join(known)})")
+        start = pd.Timestamp(start) if start is not None else None
+        end = _end_bound(end) if end is not None else None
+
+        # 1. Prune on the partition summaries; nothing is read for the partitions dropped here
+        flat = self._flatten()
+        selected = self.prune(conditions, months, start, end, datasets)
+        stats = self.last_stats = QueryStats(len(flat['lo']))
+        return self._scan(flat, selected, conditions, start, end, columns, limit, stats)
+
+    def _scan(self, flat, selected, conditions, start, end, columns, limit, stats):
+        bounds = {} # Per dataset: row range of [start, end] and output columns
+        for position in selected:
+            if limit is not None and stats.rows_matched >= limit:
+                return
+            d = int(flat['dataset'][position])
+            frame = self.frames[d]
+            if d not in bounds:
+                first = frame.index.searchsorted([start], side='left')[0] if start is not None else 0
+                last = _last_row(frame.index, end) if end is not None else len(frame)
+                available = _columns(frame)
+                bounds[d] = (first, last, [col for col in (columns or available) if col in available])
+            first, last, out_columns = bounds[d]
+            lo = max(int(flat['lo'][position]), first)
+            hi = min(int(flat['hi'][position]), last)
+            if hi <= lo:
+                continue
+
+            # 2. One vectorized mask per condition; stop reading columns once nothing is left
+            stats.partitions_scanned += 1
+            stats.rows_scanned += hi - lo
+            mask = np.ones(hi - lo, dtype=bool)
+            for condition in conditions:
+                values = _values(frame, condition.column, lo, hi)
+                with np.errstate(invalid='ignore'):
+                    mask &= OPERATORS[condition.op](values, condition.value) & ~np.isnan(values)
+                if not mask.any():
+                    break
+            rows = np.flatnonzero(mask)
+            if limit is not None:
+                rows = rows[:limit - stats.rows_matched]
+            if rows.size == 0:
+                continue
+
+            # 3. Only the matching rows of the requested columns are materialized
+            result = pd.DataFrame({col: _values(frame, col, lo, hi)[rows] for col in out_columns},
+                                  index=_dates(frame, lo, hi)[rows])
+            stats.rows_matched += len(result)
+            yield self.names[d], result
+
+    def collect(self, *args, limit=None, **kwargs):
+        """Runs query() and concatenates the results into one frame with a 'dataset' column."""
+        parts = [rows.assign(dataset=name) for name, rows in self.query(*args, limit=limit, **kwargs)]
+        if not parts:
+            return pd.DataFrame(columns=['dataset'])
+        result = pd.concat(parts)
+        return result[['dataset'] + [col for col in result.columns if col != 'dataset']]
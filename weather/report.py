@@ -0,0 +1,138 @@
+"""
+Streaming report writer.
+
+ReportWriter appends one dataset at a time to a Markdown report and, optionally,
+to machine-readable companions: a JSON document with the statistics of every
+dataset and a tidy CSV (dataset, window, start, end, column, stat, value). Each
+dataset is written and flushed as soon as its analysis is done and nothing is
+kept afterwards, so a report over hundreds of stations needs no more memory
+than a single one. A '.gz' report path gzips the report and its companions.
+
+The summary block at the top of each dataset is read from the analysis table
+(the OVERALL_WINDOW rows), so writing a report never scans the data again.
+"""
+import csv
+import gzip
+import json
+import math
+import os
+from datetime import datetime
+
+from .summary import OVERALL_WINDOW, TABLE_COLUMNS, iter_windows
+
+COMPANION_FORMATS = ('json', 'csv')
+CSV_COLUMNS = ['dataset'] + TABLE_COLUMNS
+
+
+def summary_markdown(table):
+    """Overall summary block placed at the top of the saved report, taken from the analysis table."""
+    overall = next((w for w in iter_windows(table) if w[0] == OVERALL_WINDOW), None)
+    if overall is None or overall[3] is None:
+        return ""
+    _, start, end, stats = overall
+    records = max(int(col_stats['count']) for col_stats in stats.values())
+    lines = [
+        "\n---\n# Data Summary",
+        f"- Total Records Analyzed: {records}",
+        f"- Dataset Range: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}",
+    ]
+    if 'Temperature_C' in stats:
+        lines.append(f"- Overall Mean Temp: {stats['Temperature_C']['mean']:.2f} °C")
+    if 'Humidity_pct' in stats:
+        lines.append(f"- Overall Mean Humidity: {stats['Humidity_pct']['mean']:.2f} %")
+    return "\n".join(lines) + "\n---\n\n"
+
+
+def _open_text(path, compress):
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def _json_value(value):
+    """Timestamps as ISO strings and NaN as null, so the companion is strict JSON."""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+class ReportWriter:
+    """
+    Writes a Markdown report (plus optional JSON/CSV companions) one dataset at a time.
+    path: Markdown output; a '.gz' suffix (or compress=True) gzips it and the companions.
+    companions: any of COMPANION_FORMATS, written next to the report with the same base name.
+    """
+
+    def __init__(self, path, companions=(), compress=None):
+        unknown = set(companions) - set(COMPANION_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown companion format(s): {', '.join(sorted(unknown))}")
+        self.compress = path.endswith('.gz') if compress is None else compress
+        base = path[:-3] if path.endswith('.gz') else path
+        base = os.path.splitext(base)[0]
+        suffix = '.gz' if self.compress else ''
+
+        self.paths = [path]
+        self.datasets = 0
+        self._md = _open_text(path, self.compress)
+        self._json = self._csv = None
+        if 'json' in companions:
+            self.paths.append(f"{base}.json{suffix}")
+            self._json = _open_text(self.paths[-1], self.compress)
+            self._json.write(f'{{"created": "{datetime.now().isoformat(timespec="seconds")}", "datasets": [')
+        if 'csv' in companions:
+            self.paths.append(f"{base}.csv{suffix}")
+            self._csv_file = _open_text(self.paths[-1], self.compress)
+            self._csv = csv.writer(self._csv_file)
+            self._csv.writerow(CSV_COLUMNS)
+
+    def write_section(self, text):
+        """Appends free-form Markdown."""
+        self._md.write(text)
+
+    def write_dataset(self, table, sections, name=None):
+        """
+        Writes one dataset: a heading (when named), the summary block from `table`,
+        the Markdown `sections`, and the table rows to the companions; then flushes.
+        """
+        if name is not None:
+            separator = "\n" if self.datasets else ""
+            self._md.write(f"{separator}# Dataset: {name}\n")
+        self._md.write(summary_markdown(table) + "\n".join(sections))
+        self._md.flush()
+
+        if self._json is not None:
+            stats = {}
+            for window, start, end, window_stats in iter_windows(table):
+                stats[window] = {
+                    'start': _json_value(start),
+                    'end': _json_value(end),
+                    'columns': {col: {stat: _json_value(value) for stat, value in col_stats.items()}
+                                for col, col_stats in (window_stats or {}).items()},
+                }
+            entry = json.dumps({'dataset': name, 'windows': stats}, allow_nan=False, ensure_ascii=False)
+            self._json.write(("\n" if self.datasets == 0 else ",\n") + entry)
+            self._json.flush()
+
+        if self._csv is not None:
+            for row in table[TABLE_COLUMNS].itertuples(index=False):
+                self._csv.writerow([name, *row])
+            self._csv_file.flush()
+        self.datasets += 1
+
+    def close(self):
+        self._md.close()
+        if self._json is not None:
+            self._json.write("\n]}\n")
+            self._json.close()
+        if self._csv is not None:
+            self._csv_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
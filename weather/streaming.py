@@ -0,0 +1,200 @@
+"""
+Chunked CSV ingestion for station histories that do not fit in memory.
+
+The file is read `chunksize` rows at a time with explicit float32 dtypes,
+keeping only the numeric columns; a stray token such as '--' only sends the
+column it appears in through a slower text-and-coerce read, from the chunk it
+was found in onwards. The date layout is sniffed once from the first chunk and
+reused for the rest. Each chunk is cleaned on its own and folded straight into
+running per-day aggregates (sum, count, min, max per column), so peak memory is
+bounded by the chunk size plus one row per calendar day, not by the file size.
+Window counts, means and extremes are rebuilt exactly from those aggregates;
+std and percentiles would need the readings themselves and are left out.
+Repeated timestamps are collapsed within a chunk; a repeat that straddles two
+chunks is counted twice.
+"""
+import numpy as np
+import pandas as pd
+
+from .config import REQUIRED_COLUMNS, VALUE_COLUMNS
+from .dates import DEFAULT_DUPLICATES, LoadReport, order_and_dedupe, parse_dates
+from .engine import DataError
+from .summary import TABLE_COLUMNS
+
+DEFAULT_CHUNKSIZE = 250_000
+HEADER_SAMPLE_ROWS = 1000 # Rows read to tell numeric extra columns from text ones
+
+
+class DailyAggregates:
+    """Running per-day sum/count/min/max for each value column."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.table = None # DataFrame indexed by day, columns '<col>_sum', '<col>_count', ...
+        self.rows_read = 0
+        self.rows_dropped = 0
+
+    def _agg_spec(self):
+        spec = {}
+        for col in self.columns:
+            spec[f'{col}_sum'] = 'sum'
+            spec[f'{col}_count'] = 'sum'
+            spec[f'{col}_min'] = 'min'
+            spec[f'{col}_max'] = 'max'
+        return spec
+
+    def add_chunk(self, days, chunk):
+        """Folds one cleaned chunk (values + matching day labels) into the running table."""
+        grouped = chunk.groupby(days, sort=False)
+        parts = {}
+        for col in self.columns:
+            # Sums are kept in float64 so long hourly histories do not lose precision
+            parts[f'{col}_sum'] = grouped[col].sum(min_count=1).astype(np.float64)
+            parts[f'{col}_count'] = grouped[col].count().astype(np.int64)
+            parts[f'{col}_min'] = grouped[col].min()
+            parts[f'{col}_max'] = grouped[col].max()
+        partial = pd.DataFrame(parts)
+
+        if self.table is None:
+            self.table = partial
+        else:
+            # Only days present in both frames need combining; the result stays one row per day
+            self.table = pd.concat([self.table, partial]).groupby(level=0, sort=False).agg(self._agg_spec())
+
+    def to_frame(self):
+        """Daily means as a date-indexed, sorted float32 DataFrame (same shape as load_dataframe)."""
+        if self.table is None or self.table.empty:
+            raise DataError("File does not contain any usable records.")
+        table = self.table.sort_index()
+        means = {
+            col: (table[f'{col}_sum'] / table[f'{col}_count'].replace(0, np.nan)).astype(np.float32)
+            for col in self.columns
+        }
+        df = pd.DataFrame(means, index=table.index)
+        df.index.name = 'Date'
+        return df.dropna(subset=[c for c in VALUE_COLUMNS if c in df.columns])
+
+    def extremes(self):
+        """Per-day min/max frames as (min_df, max_df), date-indexed and sorted."""
+        table = self.table.sort_index()
+        mins = table[[f'{col}_min' for col in self.columns]].set_axis(self.columns, axis=1)
+        maxs = table[[f'{col}_max' for col in self.columns]].set_axis(self.columns, axis=1)
+        return mins, maxs
+
+    def summarize(self, windows):
+        """
+        Tidy summary table (summary.TABLE_COLUMNS) of the readings in every window:
+        count, mean, min and max, exact from the per-day aggregates (a window takes in
+        whole days). windows: {name: (start, end)}, both ends inclusive.
+        """
+        if self.table is None or self.table.empty:
+            raise DataError("File does not contain any usable records.")
+        table = self.table.sort_index()
+        days = table.index.values
+        rows = []
+        for name, (start, end) in windows.items():
+            start, end = pd.Timestamp(start), pd.Timestamp(end)
+            lo = np.searchsorted(days, start.to_datetime64(), side='left')
+            hi = np.searchsorted(days, end.to_datetime64(), side='right')
+            part = table.iloc[lo:hi]
+            for col in self.columns:
+                count = int(part[f'{col}_count'].sum())
+                stats = {'count': count, 'mean': np.nan, 'min': np.nan, 'max': np.nan}
+                if count:
+                    stats.update(mean=part[f'{col}_sum'].sum() / count,
+                                 min=part[f'{col}_min'].min(), max=part[f'{col}_max'].max())
+                rows.extend((name, start, end, col, stat, float(value)) for stat, value in stats.items())
+        return pd.DataFrame(rows, columns=TABLE_COLUMNS)
+
+
+def _value_columns(filepath):
+    """Reads the header and a few rows to decide which columns to load: the required ones plus numeric extras."""
+    sample = pd.read_csv(filepath, nrows=HEADER_SAMPLE_ROWS)
+    if not all(col in sample.columns for col in REQUIRED_COLUMNS.keys()):
+        raise DataError("File must contain 'Date', 'Temperature_C', and 'Humidity_pct' columns.")
+    return [col for col in sample.columns
+            if col in VALUE_COLUMNS or (col != 'Date' and pd.api.types.is_numeric_dtype(sample[col].dtype))]
+
+
+def _float32_chunks(filepath, columns, chunksize):
+    """
+    Yields chunks of 'Date' plus the given columns as float32. The columns are parsed with
+    an explicit float32 dtype; when a token such as '--' breaks a chunk, the read resumes
+    at that chunk with just the offending columns read as text and coerced to NaN.
+    """
+    header = list(pd.read_csv(filepath, nrows=0).columns)
+    usecols = ['Date'] + list(columns)
+    text_columns = set()
+    done = 0 # Data rows already yielded
+    while True:
+        # skiprows also skips the header line, so the same call resumes after `done` rows
+        reader = pd.read_csv(filepath, header=None, names=header, skiprows=done + 1, usecols=usecols,
+                             dtype={col: np.float32 for col in columns if col not in text_columns},
+                             chunksize=chunksize)
+        try:
+            for chunk in reader:
+                for col in text_columns:
+                    chunk[col] = pd.to_numeric(chunk[col], errors='coerce').astype(np.float32)
+                done += len(chunk)
+                yield chunk
+            return
+        except ValueError:
+            failed = pd.read_csv(filepath, header=None, names=header, skiprows=done + 1, usecols=usecols,
+                                 nrows=chunksize)
+            bad = {col for col in columns if not pd.api.types.is_numeric_dtype(failed[col].dtype)} - text_columns
+            if not bad:
+                raise
+            text_columns |= bad
+        finally:
+            reader.close()
+
+
+def stream_daily_aggregates(filepath, chunksize=DEFAULT_CHUNKSIZE, date_format=None, columns=None, progress=None,
+                            duplicates=DEFAULT_DUPLICATES, load_report=None):
+    """
+    Reads a weather CSV in chunks and returns its DailyAggregates.
+    date_format: strptime layout, 'ISO8601' or 'mixed'; sniffed from the first chunk when None.
+    progress: optional callable receiving the number of rows read so far after each chunk.
+    load_report: optional dates.LoadReport the cleaning counts are added to.
+    """
+    if columns is None:
+        columns = _value_columns(filepath)
+    aggregates = DailyAggregates(columns)
+    report = load_report if load_report is not None else LoadReport()
+
+    chunks = _float32_chunks(filepath, columns, chunksize)
+    try:
+        for chunk in chunks:
+            aggregates.rows_read += len(chunk)
+
+            # 1. Clean this chunk only
+            dates, date_format, coerced = parse_dates(chunk.pop('Date'), date_format)
+            keep = dates.notna() & chunk[VALUE_COLUMNS].notna().all(axis=1).to_numpy()
+            aggregates.rows_dropped += int(len(chunk) - keep.sum())
+            report.rows_read += len(chunk)
+            report.dates_coerced += coerced
+            report.rows_dropped += int(len(chunk) - keep.sum())
+            report.date_format = date_format
+
+            # 2. Collapse repeated timestamps, then fold the surviving rows into the per-day aggregates
+            if keep.any():
+                rows, resorted, collapsed = order_and_dedupe(chunk[keep].set_axis(dates[keep]), duplicates)
+                report.resorted |= resorted
+                report.duplicates_collapsed += collapsed
+                aggregates.add_chunk(rows.index.normalize().to_numpy(), rows)
+
+            if progress is not None:
+                progress(aggregates.rows_read)
+    except ValueError as e: # e.g. an ambiguous date layout or an unknown duplicate rule
+        raise DataError(f"Could not parse file: {e}") from e
+    finally:
+        chunks.close()
+
+    return aggregates
+
+
+def load_daily_frame(filepath, chunksize=DEFAULT_CHUNKSIZE, date_format=None, duplicates=DEFAULT_DUPLICATES,
+                     load_report=None):
+    """Streams a CSV and returns its daily-mean frame, ready for the period analysis."""
+    return stream_daily_aggregates(filepath, chunksize=chunksize, date_format=date_format, duplicates=duplicates,
+                                   load_report=load_report).to_frame()
@@ -0,0 +1,200 @@
+"""
+Vectorized multi-window, multi-column summary statistics.
+
+All window boundaries are located with one searchsorted call. Together they cut
+the sorted rows into at most 2W+1 elementary segments, and every per-segment
+total (sum, sum of squares, count, min, max) comes from a single
+np.ufunc.reduceat pass over the whole value matrix. Window statistics are then
+prefix differences / small reductions over segments, so the cost is O(rows)
+for any number of windows, columns and statistics. Columns are processed one at
+a time, so only one float64 copy of a column exists at once; a
+compact.CompactFrame is handled on its int32 offsets and decoded per column.
+Percentiles are exact for any values: every elementary segment is sorted once,
+and each window's order statistics are found by bisecting over the column's
+sorted values, counting the values below a candidate with one searchsorted per
+segment. That is O(rows log rows) per column however many windows overlap, and
+the result is interpolated linearly like np.percentile and Series.quantile.
+Given the dataset's window_index.WindowIndex, count/mean/std/min/max are read
+from it in O(log n) per window instead, and the values are only read for the
+percentiles.
+
+The result is a tidy table with one row per (window, column, statistic).
+"""
+import numpy as np
+import pandas as pd
+
+from .compact import CompactFrame
+
+DEFAULT_PERCENTILES = (10, 50, 90)
+TABLE_COLUMNS = ['window', 'start', 'end', 'column', 'stat', 'value']
+OVERALL_WINDOW = "Entire Record" # Window spanning all data; report summaries are read from it
+
+
+def numeric_columns(df):
+    """Names of the numeric columns of df, in order."""
+    if isinstance(df, CompactFrame):
+        return list(df.columns)
+    return [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col].dtype)]
+
+
+def _window_percentiles(values, valid, cuts, a, b, percentiles):
+    """Exact per-window percentiles of one column: array of shape (windows, len(percentiles))."""
+    out = np.full((len(a), len(percentiles)), np.nan)
+    pool = np.sort(values[valid]) # Candidate values for every order statistic
+    if pool.size == 0:
+        return out
+    runs = [] # Sorted valid values of each elementary segment
+    for s in range(len(cuts) - 1):
+        segment = values[cuts[s]:cuts[s + 1]]
+        runs.append(np.sort(segment[~np.isnan(segment)]))
+
+    fractions = np.asarray(percentiles, dtype=np.float64) / 100.0
+    for w in range(len(a)):
+        segments = runs[a[w]:b[w]]
+        count = sum(len(run) for run in segments)
+        if count == 0:
+            continue
+        position = fractions * (count - 1)
+        lower = np.floor(position).astype(np.int64)
+        ranks = np.concatenate((lower, np.ceil(position).astype(np.int64)))
+
+        # Smallest pool index whose value has more than `rank` window values at or below it
+        low = np.zeros(len(ranks), dtype=np.int64)
+        high = np.full(len(ranks), pool.size - 1, dtype=np.int64)
+        while (low < high).any():
+            mid = (low + high) // 2
+            below = sum(np.searchsorted(run, pool[mid], side='right') for run in segments)
+            enough = below > ranks
+            high = np.where(enough, mid, high)
+            low = np.where(enough | (low >= high), low, mid + 1)
+        ordered = pool[low]
+        low_value, high_value = ordered[:len(lower)], ordered[len(lower):]
+        out[w] = low_value + (high_value - low_value) * (position - lower)
+    return out
+
+
+def summarize(df, windows, columns=None, percentiles=DEFAULT_PERCENTILES, index=None):
+    """
+    Statistics for every (window, column) pair of a sorted, date-indexed frame (or CompactFrame).
+    windows: {name: (start, end)}, both ends inclusive like df.loc[start:end].
+    columns: defaults to every numeric column.
+    index: optional WindowIndex of df answering the count/mean/std/min/max lookups.
+    Returns a tidy DataFrame (TABLE_COLUMNS) with stats count, mean, std, min, p<q>..., max
+    in that order; an empty window has count 0 and NaN elsewhere.
+    """
+    if columns is None:
+        columns = numeric_columns(df)
+    columns = list(columns)
+    names = list(windows)
+    starts = [pd.Timestamp(windows[name][0]) for name in names]
+    ends = [pd.Timestamp(windows[name][1]) for name in names]
+    stat_names = ['count', 'mean', 'std', 'min'] + [f'p{q:g}' for q in percentiles] + ['max']
+
+    # 1. Window boundaries -> elementary segments (strictly increasing cut points, 0 and n included)
+    n = len(df)
+    if isinstance(df, CompactFrame):
+        lo = df.index.searchsorted(starts, side='left')
+        hi = np.maximum(df.index.searchsorted(ends, side='right'), lo)
+        column_values = df.column
+    else:
+        dates = df.index.values
+        lo = np.searchsorted(dates, np.array([s.to_datetime64() for s in starts]), side='left')
+        hi = np.maximum(np.searchsorted(dates, np.array([e.to_datetime64() for e in ends]), side='right'), lo)
+        column_values = lambda col: df[col].to_numpy(dtype=np.float64)
+    cuts = np.unique(np.concatenate(([0, n], lo, hi)))
+    a = np.searchsorted(cuts, lo) # window w spans segments a[w] .. b[w]-1
+    b = np.searchsorted(cuts, hi)
+
+    k = len(columns)
+    stats = {name: np.full((len(names), k), np.nan) for name in stat_names}
+    stats['count'][:] = 0
+    if index is not None:
+        # With a load-time index the totals are O(log n) lookups; the values are only read for percentiles
+        for w in range(len(names)):
+            window = index.window_stats(starts[w], ends[w], columns) or {}
+            for j, col in enumerate(columns):
+                for stat, value in window.get(col, {}).items():
+                    stats[stat][w, j] = value
+
+    for j, col in enumerate(columns if n and (index is None or percentiles) else ()):
+        values = column_values(col)
+        valid = ~np.isnan(values)
+        if not valid.any():
+            continue
+        if index is None:
+            # 2. One reduceat pass per total; values are centred on the column mean for stable sums
+            seg_starts = cuts[:-1]
+            offset = values[valid].mean()
+            centred = np.where(valid, values - offset, 0.0)
+            seg_count = np.add.reduceat(valid.astype(np.int64), seg_starts)
+            seg_sum = np.add.reduceat(centred, seg_starts)
+            seg_sq = np.add.reduceat(centred * centred, seg_starts)
+            del centred
+            seg_min = np.minimum.reduceat(np.where(valid, values, np.inf), seg_starts)
+            seg_max = np.maximum.reduceat(np.where(valid, values, -np.inf), seg_starts)
+
+            def prefix(x):
+                return np.concatenate(([0], np.cumsum(x)))
+            p_count, p_sum, p_sq = prefix(seg_count), prefix(seg_sum), prefix(seg_sq)
+
+            # 3. Window totals from segment prefixes (counts/sums) and segment reductions (min/max)
+            count = (p_count[b] - p_count[a]).astype(np.float64)
+            total = p_sum[b] - p_sum[a]
+            squares = p_sq[b] - p_sq[a]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                stats['count'][:, j] = count
+                stats['mean'][:, j] = np.where(count > 0, offset + total / count, np.nan)
+                variance = (squares - total * total / count) / (count - 1)
+                stats['std'][:, j] = np.where(count > 1, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+            for w in range(len(names)):
+                if count[w] > 0:
+                    stats['min'][w, j] = seg_min[a[w]:b[w]].min()
+                    stats['max'][w, j] = seg_max[a[w]:b[w]].max()
+
+        # 4. Exact percentiles from the sorted segments
+        if percentiles:
+            pct = _window_percentiles(values, valid, cuts, a, b, percentiles)
+            for i, q in enumerate(percentiles):
+                stats[f'p{q:g}'][:, j] = pct[:, i]
+
+    # 5. Tidy table: window x column x stat
+    rows = [
+        (name, starts[w], ends[w], col, stat, float(stats[stat][w, j]))
+        for w, name in enumerate(names)
+        for j, col in enumerate(columns)
+        for stat in stat_names
+    ]
+    return pd.DataFrame(rows, columns=TABLE_COLUMNS)
+
+
+def table_from_stats(records):
+    """
+    Builds the same tidy table from precomputed statistics.
+    records: iterable of (window, start, end, stats) with stats {column: {stat: value}} or None.
+    """
+    rows = []
+    for name, start, end, stats in records:
+        for col, col_stats in (stats or {}).items():
+            for stat, value in col_stats.items():
+                rows.append((name, start, end, col, stat, float(value)))
+    table = pd.DataFrame(rows, columns=TABLE_COLUMNS)
+    # Windows without data still need a row so renderers can say so
+    missing = [(name, start, end, None, 'count', 0.0) for name, start, end, stats in records if not stats]
+    if missing:
+        table = pd.concat([table, pd.DataFrame(missing, columns=TABLE_COLUMNS)], ignore_index=True)
+    return table
+
+
+def iter_windows(table):
+    """
+    Yields (window, start, end, stats) in table order; stats is {column: {stat: value}}
+    or None when the window holds no data.
+    """
+    for name, rows in table.groupby('window', sort=False):
+        start, end = rows['start'].iloc[0], rows['end'].iloc[0]
+        stats = {}
+        for col, col_rows in rows.dropna(subset=['column']).groupby('column', sort=False):
+            stats[col] = dict(zip(col_rows['stat'], col_rows['value']))
+        if not any(s.get('count', 0) > 0 for s in stats.values()):
+            stats = None
+        yield name, start, end, stats
@@ -0,0 +1,114 @@
+"""
+Precomputed index for arbitrary-window statistics.
+
+Built once per loaded dataset: prefix sums, prefix sums of squares and prefix
+counts give any window's count, mean and std in O(1), and sparse tables give
+its min/max in O(1). Locating the window itself is a binary search on the
+sorted date index, so every query costs O(log n) regardless of how long the
+history is. A compact.CompactFrame is indexed on its int32 offsets, with its
+sparse tables kept in float32.
+"""
+import numpy as np
+import pandas as pd
+
+from .compact import CompactFrame
+from .summary import numeric_columns
+
+
+class SparseTable:
+    """Idempotent range query (min or max) over a fixed array in O(1) after O(n log n) setup."""
+
+    def __init__(self, values, func, fill):
+        self.func = func
+        level = np.where(np.isnan(values), fill, values)
+        self.levels = [level]
+        span = 1
+        # Level k covers blocks of 2**k values; stop once a block would exceed the array
+        while 2 * span <= len(values):
+            level = func(level[:-span], level[span:])
+            self.levels.append(level)
+            span *= 2
+
+    def query(self, lo, hi):
+        """Reduces values[lo:hi] (half-open, non-empty) with two overlapping power-of-two blocks."""
+        k = (hi - lo).bit_length() - 1
+        table = self.levels[k]
+        return self.func(table[lo], table[hi - (1 << k)])
+
+
+class WindowIndex:
+    """Window statistics (count/mean/std/min/max) for any date range over a sorted, date-indexed frame."""
+
+    def __init__(self, df, columns=None):
+        if columns is None:
+            columns = numeric_columns(df)
+        self.columns = list(columns)
+        self._compact = isinstance(df, CompactFrame)
+        self._dates = df.index if self._compact else df.index.values
+        self._length = len(df)
+        self._offsets = {}
+        self._sums = {}
+        self._squares = {}
+        self._counts = {}
+        self._mins = {}
+        self._maxs = {}
+
+        for col in self.columns:
+            values = df.column(col) if self._compact else df[col].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            # Summing deviations from the column mean keeps the prefix sums small, so the
+            # difference of two prefixes does not lose precision on long histories
+            offset = float(values[valid].mean()) if valid.any() else 0.0
+            centred = np.where(valid, values - offset, 0.0)
+            self._offsets[col] = offset
+            # Leading zero so that window [lo, hi) is prefix[hi] - prefix[lo]
+            self._sums[col] = np.concatenate(([0.0], np.cumsum(centred)))
+            self._squares[col] = np.concatenate(([0.0], np.cumsum(centred * centred)))
+            self._counts[col] = np.concatenate(([0], np.cumsum(valid)))
+            del centred
+            if self._compact:
+                values = values.astype(np.float32) # Extremes do not need more than the stored precision
+            self._mins[col] = SparseTable(values, np.minimum, np.inf)
+            self._maxs[col] = SparseTable(values, np.maximum, -np.inf)
+
+    def __len__(self):
+        return self._length
+
+    def bounds(self, start, end):
+        """Row range [lo, hi) covering start..end inclusive, like df.loc[start:end]."""
+        if self._compact:
+            lo = self._dates.searchsorted([start], side='left')[0]
+            hi = self._dates.searchsorted([end], side='right')[0]
+        else:
+            lo = np.searchsorted(self._dates, pd.Timestamp(start).to_datetime64(), side='left')
+            hi = np.searchsorted(self._dates, pd.Timestamp(end).to_datetime64(), side='right')
+        return int(lo), int(hi)
+
+    def window_stats(self, start, end, columns=None):
+        """
+        Statistics for rows dated start..end (inclusive).
+        Returns None for an empty window, otherwise {column: {'count', 'mean', 'std', 'min', 'max'}}.
+        """
+        lo, hi = self.bounds(start, end)
+        if hi <= lo:
+            return None
+
+        stats = {}
+        for col in (self.columns if columns is None else columns):
+            count = int(self._counts[col][hi] - self._counts[col][lo])
+            if count == 0:
+                stats[col] = {'count': 0, 'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan}
+                continue
+            total = self._sums[col][hi] - self._sums[col][lo]
+            squares = self._squares[col][hi] - self._squares[col][lo]
+            std = np.nan
+            if count > 1:
+                std = float(np.sqrt(max((squares - total * total / count) / (count - 1), 0.0)))
+            stats[col] = {
+                'count': count,
+                'mean': self._offsets[col] + total / count,
+                'std': std,
+                'min': float(self._mins[col].query(lo, hi)),
+                'max': float(self._maxs[col].query(lo, hi)),
+            }
+        return stats